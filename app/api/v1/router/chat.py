@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import List
+import json
 
 from app.core.logger import get_logger
 from app.core.dependencies import get_chat_use_case
@@ -12,12 +14,21 @@ from app.api.v1.schemas.chat import (
 
 from app.application.use_cases.chat import (
     ChatUseCase,
-    ChatInput
+    ChatInput,
+    EMPTY_QUERY_ERROR
 )
 
 router = APIRouter()
 logger = get_logger("api.chat")
 
+def _to_chat_input(request: ChatRequest) -> ChatInput:
+    """API 요청을 챗 유스케이스 입력으로 변환"""
+    return ChatInput(
+        message=request.message,
+        chat_history=[{"role": m.role, "content": m.content} for m in request.history] if request.history else [],
+        limit=request.limit or 5
+    )
+
 @router.post("/", response_model=ChatResponse)
 async def chat_with_documents(
     request: ChatRequest,
@@ -37,15 +48,15 @@ async def chat_with_documents(
     
     try:
         # 챗 입력 생성
-        chat_input = ChatInput(
-            message=request.message,
-            chat_history=[{"role": m.role, "content": m.content} for m in request.history] if request.history else [],
-            limit=request.limit or 5
-        )
+        chat_input = _to_chat_input(request)
         
         # 유스케이스 실행
         result = await chat_use_case.execute(chat_input)
         
+        if result.error == EMPTY_QUERY_ERROR:
+            # 공백만 있는 질문은 클라이언트 오류
+            raise HTTPException(status_code=400, detail=result.message)
+        
         if not result.success:
             logger.error(f"챗 응답 생성 실패: {result.error}")
             raise HTTPException(status_code=500, detail=f"챗 응답 생성 실패: {result.error}")
@@ -65,6 +76,40 @@ async def chat_with_documents(
             sources=sources
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"챗 응답 생성 중 오류 발생: {e}")
-        raise HTTPException(status_code=500, detail=f"챗 응답 생성 중 서버 오류 발생: {e}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"챗 응답 생성 중 서버 오류 발생: {e}") 
+
+@router.post("/stream/")
+async def chat_with_documents_stream(
+    request: ChatRequest,
+    chat_use_case: ChatUseCase = Depends(get_chat_use_case)
+):
+    """
+    문서 기반 챗봇 (스트리밍): 생성되는 응답을 Server-Sent Events로 전달합니다.
+    
+    첫 이벤트로 소스 문서 목록을, 이후 생성된 토큰을 순서대로 전송하며
+    마지막에 "[DONE]"을 전송합니다.
+    
+    Args:
+        request: 채팅 요청 객체
+        chat_use_case: 챗 유스케이스
+        
+    Returns:
+        text/event-stream 응답
+    """
+    logger.info(f"챗 스트리밍 요청 수신: {request.message}")
+    chat_input = _to_chat_input(request)
+    
+    async def event_stream():
+        try:
+            async for event in chat_use_case.execute_stream(chat_input):
+                yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            logger.exception(f"챗 스트리밍 응답 생성 중 오류 발생: {e}")
+            yield f"data: {json.dumps({'type': 'error', 'error': str(e)}, ensure_ascii=False)}\n\n"
+        yield "data: [DONE]\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
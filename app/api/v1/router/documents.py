@@ -1,6 +1,6 @@
 # API Endpoints for documents
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends, BackgroundTasks
-from typing import List
+from typing import List, AsyncIterator
 import logging
 
 # Import core components and dependencies using app path
@@ -26,6 +26,17 @@ from app.domain.repositories.document_repository import DocumentRepository
 router = APIRouter()
 logger = get_logger("api.documents")
 
+# 업로드 파일을 저장소로 전달할 때 읽는 청크 크기 (1MB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+async def _iter_upload_file(file: UploadFile) -> AsyncIterator[bytes]:
+    """업로드 파일을 전체 메모리에 올리지 않고 청크 단위로 읽기"""
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
 @router.post("/upload/", status_code=202)
 async def upload_document(
     background_tasks: BackgroundTasks,
@@ -42,12 +53,9 @@ async def upload_document(
         raise HTTPException(status_code=400, detail="지원되지 않는 파일 형식입니다. PDF 파일을 업로드해주세요.")
 
     try:
-        # 파일 읽기
-        file_content = await file.read()
-        
-        # 업로드 유스케이스 실행
+        # 업로드 유스케이스 실행 (파일 내용은 스트림으로 전달)
         upload_input = UploadDocumentInput(
-            file_content=file_content,
+            file_content=_iter_upload_file(file),
             filename=file.filename,
             content_type=file.content_type
         )
@@ -89,12 +97,8 @@ async def index_document_background(
     """인덱싱 작업을 백그라운드에서 실행"""
     logger.info(f"문서 인덱싱 백그라운드 작업 시작: {document_id}")
     
-    # 인덱싱 유스케이스 실행
-    index_input = IndexDocumentInput(
-        document_id=document_id,
-        chunk_size=1000,
-        chunk_overlap=200
-    )
+    # 인덱싱 유스케이스 실행 (청크 크기/중첩은 토큰 단위 기본값 사용)
+    index_input = IndexDocumentInput(document_id=document_id)
     
     index_result = await index_use_case.execute(index_input)
     
@@ -117,11 +121,8 @@ async def list_documents(
             DocumentResponse(
                 id=doc.id,
                 filename=doc.filename,
-                content_type=doc.content_type,
-                file_size=doc.file_size,
-                indexed=doc.indexed,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at
+                upload_date=doc.upload_date.isoformat(),
+                indexed=doc.indexed
             ) for doc in documents
         ]
     except Exception as e:
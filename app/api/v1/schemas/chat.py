@@ -8,7 +8,7 @@ class ChatMessage(BaseModel):
 
 class ChatRequest(BaseModel):
     """챗 요청 모델"""
-    message: str = Field(..., description="사용자 메시지")
+    message: str = Field(..., min_length=1, description="사용자 메시지")
     history: Optional[List[ChatMessage]] = Field(default=None, description="이전 대화 내역 (선택)")
     limit: Optional[int] = Field(default=5, description="검색할 문서 수 (선택)")
 
@@ -4,4 +4,5 @@ from pydantic import BaseModel
 class DocumentResponse(BaseModel):
     id: str
     filename: str
-    upload_date: str # Note: This might need adjustment based on actual data source 
\ No newline at end of file
+    upload_date: str # Note: This might need adjustment based on actual data source
+    indexed: bool = False # 인덱싱 완료 여부 (업로드 후 인덱싱 대기 시 폴링용) 
\ No newline at end of file
@@ -1,14 +1,23 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from dataclasses import dataclass
 import logging
 
 from app.domain.services.rag_service import RAGService
 from app.domain.repositories.chunk_repository import ChunkRepository
+from app.domain.value_objects.search_query import SearchQuery
+from app.domain.services.answer_cache import AnswerCache
+from app.domain.services.query_embedder import QueryEmbedder
 from app.core.logger import get_logger
 from app.core.config import AppConfig
 
 logger = get_logger("application.use_cases.chat")
 
+NO_RESULTS_MESSAGE = "질문에 관련된 정보를 찾을 수 없습니다. 다른 질문을 해보세요."
+EMPTY_QUERY_MESSAGE = "질문을 입력해주세요."
+EMPTY_QUERY_ERROR = "EMPTY_QUERY"
+# 응답 생성 최대 토큰 수 (컨텍스트 예산 계산에도 사용)
+ANSWER_MAX_TOKENS = 512
+
 @dataclass
 class ChatInput:
     """챗 요청 입력 데이터"""
@@ -35,17 +44,23 @@ class ChatUseCase:
         self,
         chunk_repository: ChunkRepository,
         rag_service: RAGService,
-        config: AppConfig
+        config: AppConfig,
+        embedding_service: Optional[QueryEmbedder] = None,
+        answer_cache: Optional[AnswerCache] = None
     ):
         """
         Args:
             chunk_repository: 청크 저장소
             rag_service: RAG 서비스
             config: 애플리케이션 설정
+            embedding_service: 쿼리 임베딩 서비스 (응답 캐시 사용 시 필요)
+            answer_cache: 유사 질문에 대한 시맨틱 응답 캐시 (없으면 캐시 미사용)
         """
         self.chunk_repository = chunk_repository
         self.rag_service = rag_service
         self.config = config
+        self.embedding_service = embedding_service
+        self.answer_cache = answer_cache if embedding_service is not None else None
         logger.info("ChatUseCase 초기화 완료")
     
     async def execute(self, input_data: ChatInput) -> ChatOutput:
@@ -58,51 +73,44 @@ class ChatUseCase:
         Returns:
             ChatOutput: 응답 메시지 및 소스 정보
         """
+        # 빈 질문은 임베딩/검색/생성 없이 바로 반환
+        if not input_data.message or not input_data.message.strip():
+            return ChatOutput(success=False, message=EMPTY_QUERY_MESSAGE, error=EMPTY_QUERY_ERROR)
+        
         try:
             logger.info(f"챗 유스케이스 실행: 메시지={input_data.message[:30]}...")
             
-            # 검색 제한 수 확인
-            limit = input_data.limit or 5
+            # 같은 질문은 임베딩 없이, 유사한 질문은 임베딩 비교로 캐시된 응답 반환 (검색과 생성 생략)
+            cached = self._get_exact_cached_answer(input_data)
+            if cached is not None:
+                return ChatOutput(success=True, message=cached["message"], sources=cached["sources"])
+            query_embedding = await self._embed_query(input_data)
+            cached = self._get_cached_answer(query_embedding, input_data)
+            if cached is not None:
+                return ChatOutput(success=True, message=cached["message"], sources=cached["sources"])
             
-            # 관련 문서 검색
-            search_results = await self.chunk_repository.search(
-                query=input_data.message,
-                limit=limit
-            )
+            contexts, sources = await self._retrieve(input_data, query_embedding)
+            contexts, sources = await self._fit_to_prompt(input_data, contexts, sources)
             
-            if not search_results:
+            if not contexts:
                 logger.warning("관련 문서를 찾을 수 없습니다.")
                 return ChatOutput(
                     success=True,
-                    message="질문에 관련된 정보를 찾을 수 없습니다. 다른 질문을 해보세요.",
+                    message=NO_RESULTS_MESSAGE,
                     sources=[]
                 )
             
-            # 검색 결과에서 텍스트 추출
-            contexts = []
-            sources = []
-            
-            for item in search_results:
-                text = item.text
-                metadata = item.metadata.dict() if hasattr(item.metadata, 'dict') else item.metadata
-                
-                contexts.append(text)
-                sources.append({
-                    "text": text,
-                    "document_id": metadata.get("document_id", "unknown"),
-                    "page_number": metadata.get("page_number", ""),
-                    "score": item.score if hasattr(item, 'score') else 0.0
-                })
-            
             # RAG 서비스를 사용하여 응답 생성
             answer = await self.rag_service.generate_answer(
                 query=input_data.message,
                 context=contexts,
-                max_tokens=512,  # 설정에서 가져올 수도 있음
+                max_tokens=ANSWER_MAX_TOKENS,
                 temperature=0.7   # 설정에서 가져올 수도 있음
             )
             
             logger.info(f"챗 응답 생성 완료: {answer[:30]}...")
+            # 생성 실패는 예외로 전달되므로 여기까지 온 응답만 캐시됨
+            self._put_cached_answer(query_embedding, input_data, answer, sources)
             
             return ChatOutput(
                 success=True,
@@ -116,4 +124,148 @@ class ChatUseCase:
                 success=False,
                 message="오류가 발생했습니다. 나중에 다시 시도해주세요.",
                 error=str(e)
-            ) 
\ No newline at end of file
+            ) 
+    
+    async def execute_stream(self, input_data: ChatInput) -> AsyncIterator[Dict[str, Any]]:
+        """
+        유스케이스 스트리밍 실행: 소스 정보를 먼저 전달한 뒤 응답을 토큰 단위로 전달
+        
+        Args:
+            input_data: 챗 입력 데이터
+            
+        Yields:
+            Dict[str, Any]: {"type": "sources", "sources": [...]} 이벤트 1회 후
+                {"type": "token", "text": str} 이벤트들 (빈 질문이면 {"type": "error"} 이벤트 1회)
+        """
+        if not input_data.message or not input_data.message.strip():
+            yield {"type": "error", "error": EMPTY_QUERY_ERROR}
+            return
+        
+        logger.info(f"챗 스트리밍 유스케이스 실행: 메시지={input_data.message[:30]}...")
+        
+        cached = self._get_exact_cached_answer(input_data)
+        if cached is None:
+            query_embedding = await self._embed_query(input_data)
+            cached = self._get_cached_answer(query_embedding, input_data)
+        if cached is not None:
+            yield {"type": "sources", "sources": cached["sources"]}
+            yield {"type": "token", "text": cached["message"]}
+            return
+        
+        contexts, sources = await self._retrieve(input_data, query_embedding)
+        contexts, sources = await self._fit_to_prompt(input_data, contexts, sources)
+        yield {"type": "sources", "sources": sources}
+        
+        if not contexts:
+            logger.warning("관련 문서를 찾을 수 없습니다.")
+            yield {"type": "token", "text": NO_RESULTS_MESSAGE}
+            return
+        
+        tokens = []
+        async for token in self.rag_service.generate_answer_stream(
+            query=input_data.message,
+            context=contexts,
+            max_tokens=ANSWER_MAX_TOKENS,
+            temperature=0.7
+        ):
+            tokens.append(token)
+            yield {"type": "token", "text": token}
+        
+        # 스트림이 끝까지 정상 완료된 경우에만 캐시
+        self._put_cached_answer(query_embedding, input_data, "".join(tokens).strip(), sources)
+    
+    async def _fit_to_prompt(
+        self,
+        input_data: ChatInput,
+        contexts: List[str],
+        sources: List[Dict[str, Any]]
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """프롬프트에 들어갈 컨텍스트만 남기고, 소스도 실제 사용된 컨텍스트의 것만 반환"""
+        if not contexts:
+            return contexts, sources
+        fitted = await self.rag_service.fit_context(input_data.message, contexts, ANSWER_MAX_TOKENS)
+        return fitted, sources[:len(fitted)]
+    
+    async def _embed_query(self, input_data: ChatInput) -> Optional[Any]:
+        """응답 캐시 조회용 쿼리 임베딩 생성 (캐시 미사용 시 None)"""
+        if self.answer_cache is None:
+            return None
+        return await self.embedding_service.embed_text(input_data.message.strip())
+    
+    def _query_key(self, input_data: ChatInput) -> str:
+        """완전 일치 캐시 키 (검색 개수가 다르면 다른 키)"""
+        return AnswerCache.make_key(f"{input_data.limit or 5}:{input_data.message.strip()}")
+    
+    def _get_exact_cached_answer(self, input_data: ChatInput) -> Optional[Dict[str, Any]]:
+        """같은 질문에 대한 캐시된 응답 조회 (임베딩 생성 전 단계)"""
+        if self.answer_cache is None:
+            return None
+        cached = self.answer_cache.get_exact(self._query_key(input_data))
+        if cached is not None:
+            logger.info("완전 일치 캐시에서 응답 반환")
+        return cached
+    
+    def _get_cached_answer(self, query_embedding: Optional[Any], input_data: ChatInput) -> Optional[Dict[str, Any]]:
+        """유사 질문에 대한 캐시된 응답 조회 (검색 개수가 같은 경우에만 사용)"""
+        if self.answer_cache is None or query_embedding is None:
+            return None
+        cached = self.answer_cache.get(query_embedding)
+        if cached is None or cached["limit"] != (input_data.limit or 5):
+            return None
+        logger.info("시맨틱 캐시에서 응답 반환")
+        return cached
+    
+    def _put_cached_answer(
+        self,
+        query_embedding: Optional[Any],
+        input_data: ChatInput,
+        answer: str,
+        sources: List[Dict[str, Any]]
+    ) -> None:
+        """생성된 응답을 캐시에 저장"""
+        if self.answer_cache is None or query_embedding is None or not answer:
+            return
+        self.answer_cache.put(query_embedding, {
+            "message": answer,
+            "sources": sources,
+            "limit": input_data.limit or 5
+        }, key=self._query_key(input_data))
+    
+    async def _retrieve(
+        self,
+        input_data: ChatInput,
+        query_embedding: Optional[Any] = None
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """관련 문서 검색 후 프롬프트용 컨텍스트와 소스 정보 반환"""
+        # 검색 제한 수 확인
+        limit = input_data.limit or 5
+        
+        # 관련 문서 검색 (캐시 조회에 쓴 쿼리 임베딩은 재사용)
+        search_results = await self.chunk_repository.search(
+            SearchQuery(text=input_data.message, top_k=limit, embedding=query_embedding)
+        )
+        
+        # 검색 결과에서 텍스트 추출
+        contexts = []
+        sources = []
+        
+        seen_texts = set()
+        
+        for item in search_results:
+            text = item.get("text", "")
+            page = item.get("page")
+            
+            # 같은 내용의 청크(다른 문서에 중복 업로드된 경우 등)는 한 번만 사용
+            if text in seen_texts:
+                continue
+            seen_texts.add(text)
+            
+            contexts.append(text)
+            sources.append({
+                "text": text,
+                "document_id": item.get("document_id", "unknown"),
+                "page_number": str(page) if page is not None else "",
+                "score": item.get("score", 0.0)
+            })
+        
+        return contexts, sources
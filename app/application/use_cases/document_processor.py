@@ -3,6 +3,7 @@ import os
 import io
 from typing import List, Dict, Any, Optional
 import pypdf # Use pypdf instead of PyPDF2 if applicable
+from charset_normalizer import from_bytes
 
 # Import from app core locations
 from app.core.config import AppConfig # Corrected path
@@ -89,21 +90,15 @@ class DocumentProcessor:
         """텍스트 파일 처리"""
         chunks = []
         try:
-            text = None
-            # Common encodings to try
-            encodings = ['utf-8', 'euc-kr', 'cp949', 'latin-1'] 
-            for encoding in encodings:
-                try:
-                    text = file_content.decode(encoding)
-                    logger.info(f"텍스트 파일 디코딩 성공 ({filename}, Encoding: {encoding})")
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if text is None:
-                logger.warning(f"모든 인코딩 시도 실패, 텍스트 디코딩 불가: {filename}")
+            # Detect the encoding once and decode a single time
+            match = from_bytes(file_content, cp_isolation=['utf_8', 'euc_kr', 'cp949', 'latin_1']).best()
+            if match is None:
+                logger.warning(f"인코딩 감지 실패, 텍스트 디코딩 불가: {filename}")
                 return []
             
+            text = str(match)
+            logger.info(f"텍스트 파일 디코딩 성공 ({filename}, Encoding: {match.encoding})")
+            
             text_chunks = self._split_text(text, chunk_size, chunk_overlap)
             
             for chunk_text in text_chunks:
@@ -136,8 +131,8 @@ class DocumentProcessor:
         try:
             split_chunks = text_splitter.split_text(text)
             logger.debug(f"텍스트 분할: {len(split_chunks)} 청크 생성 (Size: {chunk_size}, Overlap: {chunk_overlap})")
-            # Filter out empty or whitespace-only chunks that might be generated
-            return [chunk for chunk in split_chunks if chunk and not chunk.isspace()]
+            # The splitter strips surrounding whitespace, so only empty chunks need filtering
+            return [chunk for chunk in split_chunks if chunk]
         except Exception as e:
             logger.exception(f"텍스트 분할 중 오류: {e}")
             # Fallback: return the original text as a single chunk if splitting fails
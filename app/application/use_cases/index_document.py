@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
+import asyncio
+import itertools
 
 from app.domain.entities.document import DocumentEntity
 from app.domain.value_objects.document_chunk import DocumentChunk
@@ -7,17 +9,24 @@ from app.domain.repositories.document_repository import DocumentRepository
 from app.domain.repositories.chunk_repository import ChunkRepository
 from app.domain.services.document_processing_service import DocumentProcessingService
 from app.domain.services.storage_service import StorageService
+from app.domain.services.answer_cache import AnswerCache
 from app.core.logger import get_logger
 from app.core.config import AppConfig
 
 logger = get_logger("application.use_cases.index_document")
 
+# 한 번에 생성/저장하는 청크 수 (문서 크기와 무관하게 메모리 사용량 상한)
+INDEX_BATCH_SIZE = 1024
+# 기본 청크 크기/중첩 (임베딩 모델 토크나이저 기준 토큰 수, 모델 최대 입력 길이로 제한됨)
+DEFAULT_CHUNK_SIZE_TOKENS = 256
+DEFAULT_CHUNK_OVERLAP_TOKENS = 32
+
 @dataclass
 class IndexDocumentInput:
     """문서 인덱싱 유스케이스 입력"""
     document_id: str
-    chunk_size: int = 1000
-    chunk_overlap: int = 200
+    chunk_size: int = DEFAULT_CHUNK_SIZE_TOKENS
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP_TOKENS
 
 @dataclass
 class IndexDocumentOutput:
@@ -38,12 +47,15 @@ class IndexDocumentUseCase:
                  chunk_repository: ChunkRepository,
                  document_processing_service: DocumentProcessingService,
                  storage_service: StorageService,
-                 config: AppConfig):
+                 config: AppConfig,
+                 answer_cache: Optional[AnswerCache] = None):
         self.document_repository = document_repository
         self.chunk_repository = chunk_repository
         self.document_processing_service = document_processing_service
         self.storage_service = storage_service
         self.config = config
+        # 새 문서가 인덱싱되면 기존 챗 응답이 달라질 수 있으므로 비움
+        self.answer_cache = answer_cache
         logger.info("IndexDocumentUseCase 초기화 완료")
     
     async def execute(self, input_data: IndexDocumentInput) -> IndexDocumentOutput:
@@ -69,28 +81,28 @@ class IndexDocumentUseCase:
                     error="FILE_NOT_FOUND"
                 )
             
-            # 문서 청크 생성
+            # 문서 청크를 배치 단위로 생성하면서 저장 (다음 배치 생성과 현재 배치 저장을 겹쳐 실행)
+            chunk_iter = self.document_processing_service.iter_document_chunks(
+                document_id=document.id,
+                filename=document.filename,
+                file_content=file_content,
+                chunk_size=input_data.chunk_size,
+                chunk_overlap=input_data.chunk_overlap
+            )
             try:
-                chunks = self.document_processing_service.create_document_chunks(
-                    document_id=document.id,
-                    filename=document.filename,
-                    file_content=file_content,
-                    chunk_size=input_data.chunk_size,
-                    chunk_overlap=input_data.chunk_overlap
-                )
+                chunks_count = await self._save_in_batches(chunk_iter)
             except NotImplementedError:
                 # 아직 도메인 서비스 구현체가 없는 경우 기존 방식으로 대체
                 # 이 부분은 실제 구현에서 제거되어야 함
                 logger.warning("문서 처리 서비스 구현체가 없어 임시 처리를 사용합니다. 이 코드는 추후 제거될 예정입니다.")
-                chunks = []
-                
-            # 청크 저장소에 저장
-            if chunks:
-                await self.chunk_repository.save_chunks(chunks)
+                chunks_count = 0
                 
+            if chunks_count:
                 # 문서 인덱싱 완료 표시
                 document.mark_as_indexed()
                 await self.document_repository.update(document)
+                if self.answer_cache is not None:
+                    self.answer_cache.clear()
                 
                 # 임시 파일 삭제 시도
                 try:
@@ -100,7 +112,7 @@ class IndexDocumentUseCase:
                 
                 return IndexDocumentOutput(
                     document_id=input_data.document_id,
-                    chunks_count=len(chunks),
+                    chunks_count=chunks_count,
                     success=True
                 )
             else:
@@ -118,4 +130,40 @@ class IndexDocumentUseCase:
                 chunks_count=0,
                 success=False,
                 error=str(e)
-            ) 
\ No newline at end of file
+            )
+    
+    async def _save_in_batches(self, chunk_iter: Iterator[DocumentChunk]) -> int:
+        """청크 이터레이터를 INDEX_BATCH_SIZE 단위로 소비하며 저장하고 저장된 청크 수 반환
+        
+        텍스트 추출/분할은 CPU 작업이므로 스레드 풀에서 실행하며,
+        현재 배치를 저장하는 동안 다음 배치를 미리 생성합니다.
+        
+        Raises:
+            RuntimeError: 배치 저장에 실패한 경우 (부분 저장된 청크는 삭제)
+        """
+        loop = asyncio.get_running_loop()
+        
+        def next_batch() -> List[DocumentChunk]:
+            return list(itertools.islice(chunk_iter, INDEX_BATCH_SIZE))
+        
+        total = 0
+        batch = await loop.run_in_executor(None, next_batch)
+        next_future = None
+        try:
+            while batch:
+                next_future = loop.run_in_executor(None, next_batch)
+                if not await self.chunk_repository.save_chunks(batch):
+                    raise RuntimeError("CHUNK_SAVE_FAILED")
+                total += len(batch)
+                batch = await next_future
+                next_future = None
+        except Exception:
+            # 생성 중인 배치를 마저 기다려 이터레이터가 동시에 사용되지 않도록 한 뒤,
+            # 앞서 저장된 배치가 검색되지 않도록 부분 저장된 청크 제거 (문서는 미인덱싱 상태 유지)
+            if next_future is not None:
+                await asyncio.gather(next_future, return_exceptions=True)
+            await self.chunk_repository.delete_by_document_id(batch[0].document_id)
+            raise
+        
+        logger.info(f"청크 저장 완료: {total} 청크")
+        return total
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union, AsyncIterable, AsyncIterator
 
 from app.domain.entities.document import DocumentEntity
 from app.domain.repositories.document_repository import DocumentRepository
@@ -13,7 +13,7 @@ logger = get_logger("application.use_cases.upload_document")
 @dataclass
 class UploadDocumentInput:
     """문서 업로드 유스케이스 입력"""
-    file_content: bytes
+    file_content: Union[bytes, AsyncIterable[bytes]]  # 바이트 또는 바이트 청크 스트림
     filename: str
     content_type: str
     
@@ -50,19 +50,25 @@ class UploadDocumentUseCase:
                     error="UNSUPPORTED_FILE_TYPE"
                 )
             
-            # 스토리지에 파일 저장
-            # storage_service는 기존 인프라 구현체를 재사용
-            identifier, original_filename = await self.storage_service.save_file({
-                "filename": input_data.filename,
-                "content": input_data.file_content
-            })
+            # 스토리지에 파일 저장 (스트림은 메모리에 모으지 않고 그대로 전달)
+            file_content = input_data.file_content
+            size_counter = {"size": 0}
+            if isinstance(file_content, (bytes, bytearray)):
+                size_counter["size"] = len(file_content)
+            else:
+                file_content = self._count_bytes(file_content, size_counter)
+            
+            identifier, original_filename = await self.storage_service.save_file(
+                file_content,
+                input_data.filename
+            )
             
             # 문서 엔티티 생성
             document = DocumentEntity(
                 id=identifier,
                 filename=original_filename,
                 upload_date=datetime.now(),
-                metadata={"content_type": input_data.content_type, "size": len(input_data.file_content)},
+                metadata={"content_type": input_data.content_type, "size": size_counter["size"]},
                 indexed=False
             )
             
@@ -88,4 +94,11 @@ class UploadDocumentUseCase:
         """파일 유효성 검사"""
         # 지원되는 파일 형식 확인
         supported_types = ["application/pdf", "text/plain"]
-        return content_type in supported_types 
\ No newline at end of file
+        return content_type in supported_types
+    
+    @staticmethod
+    async def _count_bytes(stream: AsyncIterable[bytes], counter: Dict[str, int]) -> AsyncIterator[bytes]:
+        """스트림을 그대로 전달하면서 전체 바이트 수를 집계"""
+        async for chunk in stream:
+            counter["size"] += len(chunk)
+            yield chunk
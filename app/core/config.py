@@ -34,6 +34,7 @@ class AppConfig(BaseSettings):
     # AWS S3 설정 (STORAGE_TYPE='s3' 일 때 사용)
     S3_BUCKET: Optional[str] = os.getenv("S3_BUCKET")
     S3_REGION: Optional[str] = os.getenv("S3_REGION")
+    S3_READ_CACHE_MB: int = int(os.getenv("S3_READ_CACHE_MB", "256"))  # 읽기 캐시 최대 크기 (0이면 비활성화)
     
     # 파일 크기 제한 (단위: MB)
     MAX_FILE_SIZE_MB: int = int(os.getenv("MAX_FILE_SIZE_MB", "100"))  # 기본 100MB 제한
@@ -41,15 +42,32 @@ class AppConfig(BaseSettings):
     # Qdrant 설정
     QDRANT_HOST: str = os.getenv("QDRANT_HOST", "localhost")
     QDRANT_PORT: int = int(os.getenv("QDRANT_PORT", "6333"))
+    QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"  # gRPC(protobuf) 전송 사용
     QDRANT_COLLECTION_NAME: str = os.getenv("QDRANT_COLLECTION_NAME", "documents")
     QDRANT_SCORE_THRESHOLD: float = float(os.getenv("QDRANT_SCORE_THRESHOLD", "0.7"))
+    QDRANT_SCALAR_QUANTIZATION: bool = os.getenv("QDRANT_SCALAR_QUANTIZATION", "true").lower() == "true"  # int8 스칼라 양자화
+    QDRANT_FLOAT16_VECTORS: bool = os.getenv("QDRANT_FLOAT16_VECTORS", "true").lower() == "true"  # 원본 벡터를 float16으로 저장
+    QDRANT_VECTORS_ON_DISK: bool = os.getenv("QDRANT_VECTORS_ON_DISK", "false").lower() == "true"  # 양자화 사용 시 원본 벡터를 디스크에 저장
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = float(os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0"))  # 재채점용 오버샘플링 배수
+    QDRANT_HNSW_M: int = int(os.getenv("QDRANT_HNSW_M", "32"))  # HNSW 그래프 노드당 연결 수
+    QDRANT_HNSW_EF_CONSTRUCT: int = int(os.getenv("QDRANT_HNSW_EF_CONSTRUCT", "256"))  # 인덱스 생성 시 탐색 폭
+    QDRANT_HNSW_FULL_SCAN_THRESHOLD: int = int(os.getenv("QDRANT_HNSW_FULL_SCAN_THRESHOLD", "10000"))  # 이보다 작은 세그먼트는 전체 탐색(KB)
+    QDRANT_HNSW_EF: int = int(os.getenv("QDRANT_HNSW_EF", "128"))  # 검색 시 탐색 폭 (재현율/지연 시간 조절)
 
     # 모델 설정
     MODEL_BASE_PATH: str = os.getenv("MODEL_BASE_PATH", "./models")
+    PRELOAD_MODELS: bool = os.getenv("PRELOAD_MODELS", "true").lower() == "true"  # 앱 시작 시 LLM/임베딩 모델 미리 로드
 
     # 임베딩 모델 설정 - 프로필에 따라 자동 설정
     EMBEDDING_MODEL_ID: str = os.getenv("EMBEDDING_MODEL_ID", "")  # 초기값은 비워두고 프로필 기반으로 설정
     EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "torch").lower()  # 'torch' 또는 'onnx' (CPU용 INT8)
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"  # 콘텐츠 해시 기반 임베딩 캐시
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", "./cache/embeddings.sqlite3")
+    CHAT_ANSWER_CACHE_SIZE: int = int(os.getenv("CHAT_ANSWER_CACHE_SIZE", "10000"))  # 시맨틱 응답 캐시 항목 수 (0이면 비활성화)
+    CHAT_ANSWER_CACHE_THRESHOLD: float = float(os.getenv("CHAT_ANSWER_CACHE_THRESHOLD", "0.95"))  # 캐시 적중 최소 코사인 유사도
+    CHAT_ANSWER_CACHE_TTL_SECONDS: int = int(os.getenv("CHAT_ANSWER_CACHE_TTL_SECONDS", "600"))
 
     # 생성 모델(LLM) 설정 - 프로필에 따라 자동 설정
     GENERATION_MODEL_TYPE: str = os.getenv("GENERATION_MODEL_TYPE", "").lower()  # 'transformers' or 'gguf'
@@ -64,9 +82,11 @@ class AppConfig(BaseSettings):
     # GGUF 설정 (ctransformers)
     GPU_LAYERS: int = int(os.getenv("GPU_LAYERS", "0"))  # 프로필에 따라 달라짐
     CT_CONTEXT_LENGTH: int = int(os.getenv("CT_CONTEXT_LENGTH", "2048"))
+    CT_BATCH_SIZE: int = int(os.getenv("CT_BATCH_SIZE", "512"))  # 프롬프트 토큰을 한 번에 평가하는 배치 크기 (ctransformers 기본값 8)
     CT_MAX_NEW_TOKENS: int = int(os.getenv("CT_MAX_NEW_TOKENS", "512"))
     CT_TEMPERATURE: float = float(os.getenv("CT_TEMPERATURE", "0.7"))
     CT_TOP_P: float = float(os.getenv("CT_TOP_P", "0.9"))
+    MAX_CONTEXT_TOKENS: int = int(os.getenv("MAX_CONTEXT_TOKENS", "1280"))  # 검색 컨텍스트 토큰 상한 (실제 예산은 CT_CONTEXT_LENGTH에서 생성/프롬프트 토큰을 뺀 값, 0이면 상한 없음)
 
     # 챗봇 설정
     QA_PROMPT_TEMPLATE: str = os.getenv(
@@ -77,7 +97,11 @@ class AppConfig(BaseSettings):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._apply_profile_settings()
-    
+
+    # 의존성 함수의 lru_cache 키로 사용되므로 인스턴스 기준 해시 제공
+    # (get_app_config가 단일 인스턴스를 반환하므로 클라이언트/서비스가 프로세스당 하나로 유지됨)
+    __hash__ = object.__hash__
+
     def _apply_profile_settings(self):
         """환경 프로필에 따른 설정 적용"""
         # 프로필별 기본 설정
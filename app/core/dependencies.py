@@ -4,6 +4,7 @@ from fastapi import Depends
 import logging
 from qdrant_client import QdrantClient
 from typing import Optional
+import numpy as np
 
 # Core components
 from app.core.config import AppConfig
@@ -18,12 +19,16 @@ from app.domain.services.document_processing_service import DocumentProcessingSe
 from app.domain.services.llm_service import LLMService
 from app.domain.services.rag_service import RAGService
 from app.domain.services.storage_service import StorageService
+from app.domain.services.answer_cache import AnswerCache
+from app.domain.services.query_embedder import QueryEmbedder
 
 # Infrastructure implementations
 from app.infrastructure.repository.memory_document_repository import InMemoryDocumentRepository
 from app.infrastructure.repository.qdrant_chunk_repository import QdrantChunkRepository
 from app.infrastructure.document.document_processing_service_impl import DocumentProcessingServiceImpl
 from app.infrastructure.embedding.embedding_service import EmbeddingService, SentenceTransformerEmbedding
+from app.infrastructure.embedding.embedding_cache import EmbeddingCache
+from app.infrastructure.embedding.semantic_cache import SemanticAnswerCache
 from app.infrastructure.llm.llama_service import LlamaService
 from app.infrastructure.rag.llama_rag_service import LlamaRAGService
 from app.infrastructure.storage.storage_factory import get_storage_service as get_storage_service_from_factory
@@ -62,11 +67,12 @@ def get_storage_handler(
     logger.debug(f"스토리지 핸들러 제공: 유형={config.STORAGE_TYPE}")
     return get_storage_handler_from_infra(config)
 
+@lru_cache()
 def get_storage_service(
     config: AppConfig = Depends(get_app_config)
 ) -> StorageService:
-    """저장소 서비스 제공"""
-    logger.debug(f"저장소 서비스 제공: 유형={config.STORAGE_TYPE}")
+    """저장소 서비스 제공 (프로세스당 하나의 인스턴스 및 S3 클라이언트 재사용)"""
+    logger.info(f"저장소 서비스 초기화: 유형={config.STORAGE_TYPE}")
     return get_storage_service_from_factory(config)
 
 # --- Infrastructure Dependencies ---
@@ -77,8 +83,14 @@ def get_qdrant_client(
 ) -> QdrantClient:
     """Qdrant 클라이언트 제공"""
     try:
-        logger.info(f"Qdrant 클라이언트 초기화: {config.QDRANT_HOST}:{config.QDRANT_PORT}")
-        return QdrantClient(host=config.QDRANT_HOST, port=config.QDRANT_PORT)
+        transport = f"gRPC:{config.QDRANT_GRPC_PORT}" if config.QDRANT_PREFER_GRPC else f"HTTP:{config.QDRANT_PORT}"
+        logger.info(f"Qdrant 클라이언트 초기화: {config.QDRANT_HOST} ({transport})")
+        return QdrantClient(
+            host=config.QDRANT_HOST,
+            port=config.QDRANT_PORT,
+            grpc_port=config.QDRANT_GRPC_PORT,
+            prefer_grpc=config.QDRANT_PREFER_GRPC
+        )
     except Exception as e:
         logger.exception("Qdrant 클라이언트 초기화 실패!")
         raise RuntimeError("Qdrant 클라이언트를 초기화할 수 없습니다") from e
@@ -95,6 +107,42 @@ def get_embedding_service(
         logger.exception("임베딩 서비스 초기화 실패!")
         raise RuntimeError("임베딩 서비스를 초기화할 수 없습니다") from e
 
+@lru_cache()
+def get_embedding_cache(
+    config: AppConfig = Depends(get_app_config)
+) -> Optional[EmbeddingCache]:
+    """임베딩 캐시 제공 (비활성화 시 None)"""
+    if not config.EMBEDDING_CACHE_ENABLED:
+        return None
+    try:
+        logger.info(f"임베딩 캐시 초기화: {config.EMBEDDING_CACHE_PATH}")
+        # Qdrant가 float16으로 저장하는 경우 캐시도 같은 정밀도로 저장 (정확도 손실 없이 크기 절반)
+        return EmbeddingCache(
+            db_path=config.EMBEDDING_CACHE_PATH,
+            # 백엔드마다 임베딩 값이 다르므로 (ONNX INT8 양자화) 백엔드별로 캐시 키를 분리
+            model_id=f"{config.EMBEDDING_MODEL_ID}:{config.EMBEDDING_BACKEND}",
+            dtype=np.float16 if config.QDRANT_FLOAT16_VECTORS else np.float32
+        )
+    except Exception:
+        # 캐시는 최적화 용도이므로 실패해도 서비스는 계속 동작
+        logger.exception("임베딩 캐시 초기화 실패! 캐시 없이 진행합니다.")
+        return None
+
+@lru_cache()
+def get_answer_cache(
+    embedding_service: EmbeddingService = Depends(get_embedding_service),
+    config: AppConfig = Depends(get_app_config)
+) -> Optional[AnswerCache]:
+    """시맨틱 응답 캐시 제공 (비활성화 시 None)"""
+    if config.CHAT_ANSWER_CACHE_SIZE <= 0:
+        return None
+    return SemanticAnswerCache(
+        vector_size=embedding_service.get_vector_size(),
+        max_entries=config.CHAT_ANSWER_CACHE_SIZE,
+        threshold=config.CHAT_ANSWER_CACHE_THRESHOLD,
+        ttl_seconds=config.CHAT_ANSWER_CACHE_TTL_SECONDS
+    )
+
 # --- Repository Dependencies ---
 
 @lru_cache()
@@ -111,7 +159,8 @@ def get_document_repository() -> DocumentRepository:
 def get_chunk_repository(
     qdrant_client: QdrantClient = Depends(get_qdrant_client),
     embedding_service: EmbeddingService = Depends(get_embedding_service),
-    config: AppConfig = Depends(get_app_config)
+    config: AppConfig = Depends(get_app_config),
+    embedding_cache: Optional[EmbeddingCache] = Depends(get_embedding_cache)
 ) -> ChunkRepository:
     """청크 저장소 제공 (Qdrant 기반)"""
     try:
@@ -119,7 +168,8 @@ def get_chunk_repository(
         return QdrantChunkRepository(
             client=qdrant_client,
             embedding_service=embedding_service,
-            config=config
+            config=config,
+            embedding_cache=embedding_cache
         )
     except Exception as e:
         logger.exception("청크 저장소 초기화 실패!")
@@ -128,11 +178,16 @@ def get_chunk_repository(
 # --- Domain Service Dependencies ---
 
 @lru_cache()
-def get_document_processing_service() -> DocumentProcessingService:
-    """문서 처리 서비스 제공"""
+def get_document_processing_service(
+    embedding_service: EmbeddingService = Depends(get_embedding_service)
+) -> DocumentProcessingService:
+    """문서 처리 서비스 제공 (임베딩 모델 토크나이저 기준 청크 분할)"""
     try:
         logger.info("문서 처리 서비스 초기화")
-        return DocumentProcessingServiceImpl()
+        return DocumentProcessingServiceImpl(
+            tokenizer=embedding_service.get_tokenizer(),
+            max_tokens=embedding_service.get_max_seq_length()
+        )
     except Exception as e:
         logger.exception("문서 처리 서비스 초기화 실패!")
         raise RuntimeError("문서 처리 서비스를 초기화할 수 없습니다") from e
@@ -182,7 +237,8 @@ def get_index_document_use_case(
     chunk_repository: ChunkRepository = Depends(get_chunk_repository),
     document_processing_service: DocumentProcessingService = Depends(get_document_processing_service),
     storage_service: StorageService = Depends(get_storage_service),
-    config: AppConfig = Depends(get_app_config)
+    config: AppConfig = Depends(get_app_config),
+    answer_cache: Optional[AnswerCache] = Depends(get_answer_cache)
 ) -> IndexDocumentUseCase:
     """문서 인덱싱 유스케이스 제공"""
     return IndexDocumentUseCase(
@@ -190,7 +246,8 @@ def get_index_document_use_case(
         chunk_repository=chunk_repository,
         document_processing_service=document_processing_service,
         storage_service=storage_service,
-        config=config
+        config=config,
+        answer_cache=answer_cache
     )
 
 def get_search_documents_use_case(
@@ -204,13 +261,17 @@ def get_search_documents_use_case(
 def get_chat_use_case(
     chunk_repository: ChunkRepository = Depends(get_chunk_repository),
     rag_service: RAGService = Depends(get_rag_service),
-    config: AppConfig = Depends(get_app_config)
+    config: AppConfig = Depends(get_app_config),
+    embedding_service: QueryEmbedder = Depends(get_embedding_service),
+    answer_cache: Optional[AnswerCache] = Depends(get_answer_cache)
 ) -> ChatUseCase:
     """챗 유스케이스 제공"""
     return ChatUseCase(
         chunk_repository=chunk_repository,
         rag_service=rag_service,
-        config=config
+        config=config,
+        embedding_service=embedding_service,
+        answer_cache=answer_cache
     )
 
 # --- Legacy Dependencies (삭제) ---
@@ -260,6 +321,8 @@ def get_model_config(config: AppConfig = Depends(get_app_config)):
         "model_base_path": config.MODEL_BASE_PATH,
         "embedding_model_id": config.EMBEDDING_MODEL_ID,
         "embedding_batch_size": config.EMBEDDING_BATCH_SIZE,
+        "embedding_cache_enabled": config.EMBEDDING_CACHE_ENABLED,
+        "embedding_cache_path": config.EMBEDDING_CACHE_PATH,
         "generation_model_type": config.GENERATION_MODEL_TYPE,
         "generation_model_id": config.GENERATION_MODEL_ID,
         "generation_model_gguf_filename": config.GENERATION_MODEL_GGUF_FILENAME,
@@ -289,8 +352,17 @@ def get_qdrant_config(config: AppConfig = Depends(get_app_config)):
     return {
         "host": config.QDRANT_HOST,
         "port": config.QDRANT_PORT,
+        "grpc_port": config.QDRANT_GRPC_PORT,
+        "prefer_grpc": config.QDRANT_PREFER_GRPC,
         "collection_name": config.QDRANT_COLLECTION_NAME,
-        "score_threshold": config.QDRANT_SCORE_THRESHOLD
+        "score_threshold": config.QDRANT_SCORE_THRESHOLD,
+        "scalar_quantization": config.QDRANT_SCALAR_QUANTIZATION,
+        "float16_vectors": config.QDRANT_FLOAT16_VECTORS,
+        "vectors_on_disk": config.QDRANT_VECTORS_ON_DISK,
+        "quantization_oversampling": config.QDRANT_QUANTIZATION_OVERSAMPLING,
+        "hnsw_m": config.QDRANT_HNSW_M,
+        "hnsw_ef_construct": config.QDRANT_HNSW_EF_CONSTRUCT,
+        "hnsw_ef": config.QDRANT_HNSW_EF
     }
 
 def get_environment_info(config: AppConfig = Depends(get_app_config)):
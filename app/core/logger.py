@@ -1,6 +1,8 @@
 import os
+import queue
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # 로그 디렉토리 설정
 LOG_DIR = os.environ.get("LOG_DIR", "/app/logs")
@@ -11,10 +13,50 @@ if not os.path.exists(LOG_DIR):
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+class _NamedFileHandler(logging.Handler):
+    """
+    로거 이름별 로그 파일로 레코드를 나누어 기록하는 핸들러
+    
+    QueueListener 스레드에서만 호출되며, 로거 이름마다 RotatingFileHandler를 하나씩 둡니다.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._handlers = {}
+        self._formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self._handlers.get(record.name)
+        if handler is None:
+            handler = RotatingFileHandler(
+                os.path.join(LOG_DIR, f"{record.name}.log"),
+                maxBytes=10 * 1024 * 1024,  # 10MB
+                backupCount=5
+            )
+            handler.setFormatter(self._formatter)
+            self._handlers[record.name] = handler
+        handler.handle(record)
+    
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
+        super().close()
+
+# 실제 콘솔/파일 쓰기는 백그라운드 리스너 스레드가 담당 (이벤트 루프에서 디스크 I/O 차단 방지)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
+_queue_listener = QueueListener(_log_queue, _console_handler, _NamedFileHandler())
+_queue_listener.start()
+atexit.register(_queue_listener.stop)
+
 def get_logger(name: str, level=logging.INFO) -> logging.Logger:
     """
     로거 인스턴스 생성
     
+    로거에는 QueueHandler만 연결되며, 로그 레코드는 큐를 통해 백그라운드
+    리스너로 전달되어 콘솔과 로거 이름별 파일에 기록됩니다.
+    
     Args:
         name: 로거 이름
         level: 로깅 레벨
@@ -30,26 +72,10 @@ def get_logger(name: str, level=logging.INFO) -> logging.Logger:
     if logger.handlers:
         return logger
     
-    # 콘솔 핸들러 추가
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_format = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_handler.setFormatter(console_format)
-    
-    # 파일 핸들러 추가
-    log_file = os.path.join(LOG_DIR, f"{name}.log")
-    file_handler = RotatingFileHandler(
-        log_file, 
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5
-    )
-    file_handler.setLevel(level)
-    file_format = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    file_handler.setFormatter(file_format)
-    
-    # 핸들러 등록
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # 큐 핸들러 등록 (논블로킹)
+    queue_handler = QueueHandler(_log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
     
     return logger
 
@@ -60,6 +86,15 @@ generation_logger = get_logger('generation')
 embedding_logger = get_logger('embedding')
 retrieval_logger = get_logger('retrieval')
 
+# 이름별 로거 조회 테이블 (미리 정의된 로거 + 이후 생성된 로거를 메모이즈)
+_LOGGERS = {
+    'app': app_logger,
+    'model_manager': model_logger,
+    'generation': generation_logger,
+    'embedding': embedding_logger,
+    'retrieval': retrieval_logger
+}
+
 # 로거 가져오기 함수
 def get_named_logger(name):
     """
@@ -71,17 +106,8 @@ def get_named_logger(name):
     Returns:
         logger: 로거 인스턴스
     """
-    # 미리 정의된 로거 중에서 찾기
-    predefined = {
-        'app': app_logger,
-        'model_manager': model_logger,
-        'generation': generation_logger,
-        'embedding': embedding_logger,
-        'retrieval': retrieval_logger
-    }
-    
-    if name in predefined:
-        return predefined[name]
-    else:
-        # 정의되지 않은 이름은, 새 로거 생성
-        return get_logger(name) 
\ No newline at end of file
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        # 정의되지 않은 이름은 새 로거를 생성하고 다음 호출을 위해 저장
+        logger = _LOGGERS[name] = get_logger(name)
+    return logger
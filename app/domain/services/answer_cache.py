@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+import hashlib
+
+class AnswerCache(ABC):
+    """
+    질의 응답 캐시 인터페이스
+    
+    같은 질문은 쿼리 키로, 유사한 질문은 쿼리 임베딩으로 이전에 생성한 응답을 조회합니다.
+    문서 인덱스가 바뀌면 기존 응답이 달라질 수 있으므로 전체 초기화를 지원합니다.
+    """
+    
+    @staticmethod
+    def make_key(query: str) -> str:
+        """완전 일치 조회용 쿼리 키 생성 (SHA-256)"""
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()
+    
+    @abstractmethod
+    def get_exact(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 쿼리 키로 저장된 응답을 조회합니다.
+        
+        Args:
+            key: make_key로 만든 쿼리 키
+            
+        Returns:
+            저장된 응답 (없거나 만료되었으면 None)
+        """
+        pass
+    
+    @abstractmethod
+    def get(self, embedding: Any) -> Optional[Dict[str, Any]]:
+        """
+        유사한 쿼리에 대해 저장된 응답을 조회합니다.
+        
+        Args:
+            embedding: 정규화된 쿼리 임베딩
+            
+        Returns:
+            저장된 응답 (없거나 만료되었으면 None)
+        """
+        pass
+    
+    @abstractmethod
+    def put(self, embedding: Any, value: Dict[str, Any], key: Optional[str] = None) -> None:
+        """
+        쿼리 임베딩과 응답을 저장합니다.
+        
+        Args:
+            embedding: 정규화된 쿼리 임베딩
+            value: 저장할 응답
+            key: 완전 일치 조회용 쿼리 키 (선택)
+        """
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 응답을 제거합니다."""
+        pass
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 import os
 import io
 from datetime import datetime
@@ -48,8 +48,8 @@ class DocumentProcessingService(ABC):
         
         Args:
             text: 분할할 텍스트
-            chunk_size: 청크 크기
-            chunk_overlap: 청크 중첩 크기
+            chunk_size: 청크 크기 (구현체가 토크나이저를 사용하면 토큰 수, 아니면 문자 수)
+            chunk_overlap: 청크 중첩 크기 (chunk_size와 같은 단위)
             
         Returns:
             List[str]: 분할된 청크 텍스트 목록
@@ -70,11 +70,34 @@ class DocumentProcessingService(ABC):
             document_id: 문서 ID
             filename: 파일명
             file_content: 파일 내용
-            chunk_size: 청크 크기
-            chunk_overlap: 청크 중첩 크기
+            chunk_size: 청크 크기 (구현체가 토크나이저를 사용하면 토큰 수, 아니면 문자 수)
+            chunk_overlap: 청크 중첩 크기 (chunk_size와 같은 단위)
             
         Returns:
             List[DocumentChunk]: 생성된 청크 목록
         """
         # 실제 구현은 인프라스트럭처 계층에 위임
-        pass 
\ No newline at end of file
+        pass
+    
+    def iter_document_chunks(self, 
+                             document_id: str, 
+                             filename: str, 
+                             file_content: bytes, 
+                             chunk_size: int, 
+                             chunk_overlap: int) -> Iterator[DocumentChunk]:
+        """파일에서 문서 청크를 하나씩 생성
+        
+        전체 청크 목록을 만들지 않고 순차적으로 소비할 수 있도록 제공합니다.
+        기본 구현은 create_document_chunks 결과를 순회하며, 스트리밍을 지원하는
+        구현체는 이 메서드를 재정의합니다.
+        
+        Returns:
+            Iterator[DocumentChunk]: 문서 순서대로의 청크
+        """
+        yield from self.create_document_chunks(
+            document_id=document_id,
+            filename=filename,
+            file_content=file_content,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap
+        )
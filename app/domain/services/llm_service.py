@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator
 
 class LLMService(ABC):
     """
@@ -29,9 +29,52 @@ class LLMService(ABC):
             
         Returns:
             생성된 텍스트
+            
+        Raises:
+            RuntimeError: 텍스트 생성 실패 시
+        """
+        pass
+    
+    @abstractmethod
+    def generate_stream(
+        self, 
+        prompt: str, 
+        max_tokens: int = 512, 
+        temperature: float = 0.7,
+        top_p: float = 0.95,
+        stop: Optional[list] = None
+    ) -> AsyncIterator[str]:
+        """
+        주어진 프롬프트를 기반으로 텍스트를 토큰 단위로 스트리밍 생성합니다.
+        
+        Args:
+            prompt: 생성의 기반이 되는 프롬프트 텍스트
+            max_tokens: 생성할 최대 토큰 수
+            temperature: 생성 다양성 조절 파라미터 (높을수록 다양한 답변)
+            top_p: 확률 분포에서 상위 p%의 토큰만 샘플링 (핵 샘플링)
+            stop: 생성을 중지할 토큰 목록
+            
+        Yields:
+            생성된 텍스트 조각
         """
         pass
     
+    async def count_tokens(self, text: str) -> Optional[int]:
+        """
+        텍스트의 토큰 수를 반환합니다.
+        
+        기본 구현은 토큰 수를 알 수 없음을 뜻하는 None을 반환하며,
+        토크나이저를 제공하는 구현체는 이 메서드를 재정의합니다.
+        (토크나이저가 생성과 모델 상태를 공유할 수 있으므로 비동기로 정의)
+        
+        Args:
+            text: 토큰 수를 셀 텍스트
+            
+        Returns:
+            토큰 수 (알 수 없으면 None)
+        """
+        return None
+    
     @abstractmethod
     async def get_model_info(self) -> Dict[str, Any]:
         """
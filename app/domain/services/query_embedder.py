@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+class QueryEmbedder(ABC):
+    """
+    쿼리 임베딩 인터페이스
+    
+    응답 캐시 조회 및 검색에 사용할 질의 임베딩을 생성합니다.
+    """
+    
+    @abstractmethod
+    async def embed_text(self, text: str) -> Optional[Any]:
+        """
+        텍스트 임베딩을 생성합니다.
+        
+        Args:
+            text: 임베딩할 텍스트
+            
+        Returns:
+            정규화된 float32 벡터 (실패 시 None)
+        """
+        pass
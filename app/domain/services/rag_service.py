@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 
 class RAGService(ABC):
     """
@@ -27,9 +27,51 @@ class RAGService(ABC):
             
         Returns:
             생성된 응답 텍스트
+            
+        Raises:
+            RuntimeError: 응답 생성 실패 시 (호출자가 실패 응답을 캐시/반환하지 않도록 예외로 알림)
+        """
+        pass
+    
+    @abstractmethod
+    def generate_answer_stream(
+        self, 
+        query: str, 
+        context: List[str], 
+        max_tokens: int = 512, 
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        주어진 쿼리와 검색된 컨텍스트를 기반으로 응답을 스트리밍 생성합니다.
+        
+        Args:
+            query: 사용자 질의
+            context: 관련 문서 컨텍스트 목록
+            max_tokens: 생성할 최대 토큰 수
+            temperature: 생성 다양성 조절 파라미터 (높을수록 다양한 답변)
+            
+        Yields:
+            생성된 응답 텍스트 조각
         """
         pass
     
+    async def fit_context(self, query: str, context: List[str], max_tokens: int = 512) -> List[str]:
+        """
+        프롬프트에 실제로 들어갈 컨텍스트를 반환합니다 (관련도 순서의 앞부분).
+        
+        기본 구현은 모든 컨텍스트를 사용하며, 모델 컨텍스트 길이 제한이 있는
+        구현체는 이 메서드를 재정의합니다. 호출자는 반환된 개수만큼의 소스만 노출합니다.
+        
+        Args:
+            query: 사용자 질의
+            context: 관련도 순서의 컨텍스트 목록
+            max_tokens: 생성할 최대 토큰 수
+            
+        Returns:
+            사용될 컨텍스트 목록 (입력 목록의 앞부분)
+        """
+        return context
+    
     @abstractmethod
     async def get_system_prompt(self) -> str:
         """
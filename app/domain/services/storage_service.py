@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union, AsyncIterable, List, Dict
 import io
 
 class StorageService(ABC):
@@ -11,12 +11,12 @@ class StorageService(ABC):
     """
     
     @abstractmethod
-    async def save_file(self, file_content: bytes, filename: str) -> Tuple[str, str]:
+    async def save_file(self, file_content: Union[bytes, AsyncIterable[bytes]], filename: str) -> Tuple[str, str]:
         """
         파일을 저장소에 저장합니다.
         
         Args:
-            file_content: 파일 내용 (바이트)
+            file_content: 파일 내용 (바이트 또는 바이트 청크 스트림)
             filename: 원본 파일 이름
             
         Returns:
@@ -55,4 +55,19 @@ class StorageService(ABC):
         Returns:
             bool: 삭제 성공 여부
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def delete_files(self, identifiers: List[str]) -> Dict[str, bool]:
+        """
+        여러 파일을 한 번에 삭제합니다.
+        
+        기본 구현은 delete_file을 하나씩 호출하며, 일괄 삭제 API를 지원하는
+        구현체는 이 메서드를 재정의합니다.
+        
+        Args:
+            identifiers: 파일 식별자 목록
+            
+        Returns:
+            Dict[str, bool]: 식별자별 삭제 성공 여부
+        """
+        return {identifier: await self.delete_file(identifier) for identifier in identifiers}
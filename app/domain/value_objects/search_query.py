@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Optional, Any
 
 @dataclass(frozen=True)  # 불변(immutable) 값 객체
 class SearchQuery:
@@ -9,6 +9,7 @@ class SearchQuery:
     """
     text: str  # 쿼리 텍스트
     top_k: int = 5  # 검색 결과 개수 제한
+    embedding: Optional[Any] = field(default=None, compare=False)  # 미리 계산된 쿼리 임베딩 (있으면 재계산 생략)
     
     def __post_init__(self):
         """데이터 유효성 검증"""
@@ -1,7 +1,8 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import os
 import io
 import pypdf  # pypdf 사용
+from charset_normalizer import from_bytes
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 from app.domain.value_objects.document_chunk import DocumentChunk
@@ -10,6 +11,9 @@ from app.core.logger import get_logger
 
 logger = get_logger("infrastructure.document.processing")
 
+# 텍스트 파일 인코딩 감지 후보 (한국어 문서 우선)
+TEXT_ENCODINGS = ['utf_8', 'euc_kr', 'cp949', 'latin_1']
+
 class DocumentProcessingServiceImpl(DocumentProcessingService):
     """문서 처리 서비스 구현체
     
@@ -17,9 +21,53 @@ class DocumentProcessingServiceImpl(DocumentProcessingService):
     이 클래스는 실제 라이브러리(pypdf, langchain)에 의존합니다.
     """
     
+    def __init__(self, tokenizer: Optional[Any] = None, max_tokens: Optional[int] = None):
+        """
+        Args:
+            tokenizer: 임베딩 모델의 HuggingFace 토크나이저 (선택).
+                지정하면 청크 길이를 문자 수 대신 토큰 수로 측정합니다.
+            max_tokens: 임베딩 모델의 최대 입력 토큰 수 (선택)
+        """
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+    
+    def _build_text_splitter(self, chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+        """청크 길이 측정 방식에 맞는 텍스트 분할기 생성
+        
+        토크나이저가 있으면 chunk_size/chunk_overlap을 토큰 수로 해석하고, chunk_size는
+        모델 최대 입력 토큰 수(max_tokens)로 제한합니다. 제한된 경우 중첩 크기도 같은 비율로 줄입니다.
+        토크나이저가 없으면 문자 수로 해석합니다.
+        """
+        separators = ["\n\n", "\n", ".", " ", ""]
+        
+        if self.tokenizer is None:
+            return RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=separators
+            )
+        
+        # 임베딩 모델 토크나이저 기준으로 분할 (모델 입력 한도를 넘는 청크가 잘리지 않도록 상한 적용)
+        token_chunk_size = min(chunk_size, self.max_tokens) if self.max_tokens else chunk_size
+        token_chunk_overlap = chunk_overlap * token_chunk_size // chunk_size
+        if token_chunk_size < chunk_size:
+            logger.debug(f"청크 크기를 모델 최대 입력 토큰 수로 제한: {chunk_size} -> {token_chunk_size} 토큰")
+        return RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+            self.tokenizer,
+            chunk_size=token_chunk_size,
+            chunk_overlap=token_chunk_overlap,
+            separators=separators
+        )
+    
     def extract_text_from_pdf(self, file_content: bytes) -> Dict[int, str]:
         """PDF 파일에서 텍스트 추출"""
-        result = {}
+        result = dict(self._iter_pdf_pages(file_content))
+        logger.info(f"PDF 텍스트 추출 완료: {len(result)} 페이지")
+        return result
+    
+    def _iter_pdf_pages(self, file_content: bytes) -> Iterator[Tuple[int, str]]:
+        """PDF 페이지를 순서대로 읽어 (페이지 번호, 텍스트) 생성"""
         try:
             pdf_file = io.BytesIO(file_content)
             pdf_reader = pypdf.PdfReader(pdf_file)
@@ -28,35 +76,23 @@ class DocumentProcessingServiceImpl(DocumentProcessingService):
                 try:
                     text = page.extract_text()
                     if text and not text.isspace():
-                        result[page_num + 1] = text  # 1-based 페이지 번호
+                        yield page_num + 1, text  # 1-based 페이지 번호
                 except Exception as e:
                     logger.error(f"PDF 페이지 처리 중 오류 (Page {page_num + 1}): {e}")
-            
-            logger.info(f"PDF 텍스트 추출 완료: {len(result)} 페이지")
         except Exception as e:
             logger.exception(f"PDF 텍스트 추출 중 오류: {e}")
-        
-        return result
     
     def extract_text_from_text_file(self, file_content: bytes) -> str:
         """텍스트 파일에서 텍스트 추출"""
-        # 여러 인코딩 시도
-        encodings = ['utf-8', 'euc-kr', 'cp949', 'latin-1']
-        text = None
-        
-        for encoding in encodings:
-            try:
-                text = file_content.decode(encoding)
-                logger.info(f"텍스트 파일 디코딩 성공 (Encoding: {encoding})")
-                break
-            except UnicodeDecodeError:
-                continue
+        # 한 번의 감지로 인코딩을 결정하고 한 번만 디코딩
+        match = from_bytes(file_content, cp_isolation=TEXT_ENCODINGS).best()
         
-        if text is None:
-            logger.warning("텍스트 디코딩 실패: 모든 인코딩 시도 실패")
+        if match is None:
+            logger.warning("텍스트 디코딩 실패: 인코딩을 감지할 수 없습니다")
             return ""
         
-        return text
+        logger.info(f"텍스트 파일 디코딩 성공 (Encoding: {match.encoding})")
+        return str(match)
     
     def chunk_text(self, text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
         """텍스트를 청크로 분할"""
@@ -64,20 +100,17 @@ class DocumentProcessingServiceImpl(DocumentProcessingService):
             return []
         
         # langchain RecursiveCharacterTextSplitter 사용
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ".", " ", ""]
-        )
+        text_splitter = self._build_text_splitter(chunk_size, chunk_overlap)
         
         try:
             chunks = text_splitter.split_text(text)
             logger.debug(f"텍스트 분할 완료: {len(chunks)} 청크 생성")
-            return [chunk for chunk in chunks if chunk and not chunk.isspace()]
+            # 분할기가 청크 앞뒤 공백을 제거하므로 빈 문자열만 걸러내면 충분
+            return [chunk for chunk in chunks if chunk]
         except Exception as e:
             logger.exception(f"텍스트 분할 중 오류: {e}")
-            return [text] if text and not text.isspace() else []
+            # 진입 시 이미 공백 여부를 검사했으므로 재검사 불필요
+            return [text]
     
     def create_document_chunks(self, 
                                document_id: str, 
@@ -86,24 +119,38 @@ class DocumentProcessingServiceImpl(DocumentProcessingService):
                                chunk_size: int, 
                                chunk_overlap: int) -> List[DocumentChunk]:
         """파일 내용에서 문서 청크 생성"""
-        chunks = []
+        chunks = list(self.iter_document_chunks(
+            document_id=document_id,
+            filename=filename,
+            file_content=file_content,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap
+        ))
+        logger.info(f"문서 청크 생성 완료: {filename}, {len(chunks)} 청크")
+        return chunks
+    
+    def iter_document_chunks(self, 
+                             document_id: str, 
+                             filename: str, 
+                             file_content: bytes, 
+                             chunk_size: int, 
+                             chunk_overlap: int) -> Iterator[DocumentChunk]:
+        """파일 내용에서 문서 청크를 하나씩 생성 (PDF는 페이지 단위로 추출/분할)"""
         extension = os.path.splitext(filename)[1].lower()
         
         if extension == '.pdf':
             # PDF 파일 처리
-            page_texts = self.extract_text_from_pdf(file_content)
-            
-            for page_num, page_text in page_texts.items():
+            for page_num, page_text in self._iter_pdf_pages(file_content):
                 text_chunks = self.chunk_text(page_text, chunk_size, chunk_overlap)
                 
                 for i, chunk_text in enumerate(text_chunks):
-                    chunks.append(DocumentChunk(
+                    yield DocumentChunk(
                         text=chunk_text,
                         source=filename,
                         document_id=document_id,
                         page=page_num,
                         index=i
-                    ))
+                    )
         
         elif extension in ['.txt', '.md']:
             # 텍스트 파일 처리
@@ -111,16 +158,13 @@ class DocumentProcessingServiceImpl(DocumentProcessingService):
             text_chunks = self.chunk_text(text, chunk_size, chunk_overlap)
             
             for i, chunk_text in enumerate(text_chunks):
-                chunks.append(DocumentChunk(
+                yield DocumentChunk(
                     text=chunk_text,
                     source=filename,
                     document_id=document_id,
                     page=None,
                     index=i
-                ))
+                )
         
         else:
             logger.warning(f"지원되지 않는 파일 형식: {extension}")
-        
-        logger.info(f"문서 청크 생성 완료: {filename}, {len(chunks)} 청크")
-        return chunks 
\ No newline at end of file
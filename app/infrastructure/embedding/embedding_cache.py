@@ -0,0 +1,83 @@
+from typing import List, Dict, Iterable, Tuple
+import os
+import hashlib
+import sqlite3
+import threading
+import numpy as np
+
+from app.core.logger import get_logger
+
+logger = get_logger("infrastructure.embedding.cache")
+
+# SQLite 바인딩 변수 제한을 넘지 않도록 조회 시 분할 크기
+_LOOKUP_BATCH_SIZE = 500
+
+class EmbeddingCache:
+    """콘텐츠 해시 기반 임베딩 캐시
+
+    sha256(모델 ID + 저장 타입 + 텍스트)를 키로 임베딩 벡터를 로컬 SQLite에 저장합니다.
+    동일한 문서를 다시 인덱싱할 때 임베딩 재계산을 건너뛸 수 있습니다.
+    """
+
+    def __init__(self, db_path: str, model_id: str, dtype: np.dtype = np.float32):
+        """
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            model_id: 임베딩 모델 ID (모델이 바뀌면 캐시 키도 달라짐)
+            dtype: 벡터 저장 타입 (float16이면 캐시 크기 절반, 타입이 바뀌면 캐시 키도 달라짐)
+        """
+        self.db_path = db_path
+        self.model_id = model_id
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        logger.info(f"임베딩 캐시 초기화: {db_path} (모델={model_id}, 타입={self.dtype.name})")
+
+    def make_key(self, text: str) -> bytes:
+        """텍스트에 대한 캐시 키 생성"""
+        # 기존 float32 항목과 키가 겹치지 않도록 float32가 아닌 경우에만 타입을 키에 포함
+        prefix = self.model_id if self.dtype == np.float32 else f"{self.model_id}\0{self.dtype.name}"
+        return hashlib.sha256(f"{prefix}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """여러 키에 대한 캐시된 임베딩 조회 (없는 키는 결과에서 제외)"""
+        found: Dict[bytes, np.ndarray] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._lock:
+            for start in range(0, len(unique_keys), _LOOKUP_BATCH_SIZE):
+                batch = unique_keys[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT hash, vector FROM embeddings WHERE hash IN ({placeholders})",
+                    batch
+                ).fetchall()
+                for key, vector in rows:
+                    found[bytes(key)] = np.frombuffer(vector, dtype=self.dtype)
+
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]]) -> None:
+        """임베딩 일괄 저장 (이미 있는 키는 무시)"""
+        rows = [
+            (key, np.ascontiguousarray(vector, dtype=self.dtype).tobytes())
+            for key, vector in items
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (hash, vector) VALUES (?, ?)",
+                rows
+            )
+            self._conn.commit()
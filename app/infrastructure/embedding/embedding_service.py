@@ -1,68 +1,146 @@
-from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from abc import abstractmethod
+from typing import List, Optional, Union, Any, Tuple, Set
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
+from app.domain.services.query_embedder import QueryEmbedder
 from app.core.logger import get_logger
 from app.core.config import AppConfig
 
 logger = get_logger("infrastructure.embedding")
 
-class EmbeddingService(ABC):
+# 동시에 들어온 단건 임베딩 요청을 묶어 처리하는 마이크로 배치 설정
+MICRO_BATCH_MAX_SIZE = 16
+MICRO_BATCH_MAX_WAIT_SECONDS = 0.005
+
+# 모델 추론 전용 스레드 풀 (torch 연산 중에는 GIL이 해제되므로 이벤트 루프가 막히지 않음)
+_EMBED_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+
+class EmbeddingService(QueryEmbedder):
     """임베딩 서비스 인터페이스
     
     텍스트 임베딩을 생성하는 인터페이스입니다.
     """
     
     @abstractmethod
-    async def embed_text(self, text: str) -> Optional[List[float]]:
-        """텍스트 임베딩 생성"""
+    async def embed_text(self, text: str) -> Optional[np.ndarray]:
+        """텍스트 임베딩 생성 (float32 벡터 반환)"""
         pass
     
     @abstractmethod
-    async def embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
-        """여러 텍스트 임베딩 생성 (배치 처리)"""
+    async def embed_texts(self, texts: List[str]) -> Optional[np.ndarray]:
+        """여러 텍스트 임베딩 생성 (배치 처리, float32 배열 반환)"""
         pass
     
     @abstractmethod
     def get_vector_size(self) -> int:
         """임베딩 벡터 크기 반환"""
         pass
+    
+    @abstractmethod
+    def get_tokenizer(self) -> Optional[Any]:
+        """임베딩 모델의 토크나이저 반환 (없으면 None)"""
+        pass
+    
+    @abstractmethod
+    def get_max_seq_length(self) -> Optional[int]:
+        """임베딩 모델의 최대 입력 토큰 수 반환 (없으면 None)"""
+        pass
 
 class SentenceTransformerEmbedding(EmbeddingService):
     """SentenceTransformer 기반 임베딩 서비스 구현체"""
     
     def __init__(self, config: AppConfig):
         self.model_name = config.EMBEDDING_MODEL_ID
+        self.batch_size = config.EMBEDDING_BATCH_SIZE
+        # 마이크로 배치 대기열: (텍스트, 결과 Future)
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: Set[asyncio.Task] = set()
         
         try:
-            # 모델 로드
-            self.model = SentenceTransformer(self.model_name)
-            logger.info(f"SentenceTransformer 모델 로드 완료: {self.model_name}")
+            if config.EMBEDDING_BACKEND == "onnx":
+                # CPU 배포용 ONNX Runtime INT8 백엔드 (encode 인터페이스 동일)
+                from app.infrastructure.embedding.onnx_encoder import OnnxSentenceEncoder
+                self.model = OnnxSentenceEncoder(
+                    self.model_name,
+                    cache_dir=f"{config.get_embedding_path()}-onnx-int8"
+                )
+            else:
+                # 모델 로드 (torch를 끌어오는 무거운 import는 실제 사용 시점까지 지연)
+                from sentence_transformers import SentenceTransformer
+                self.model = SentenceTransformer(self.model_name)
+            logger.info(f"임베딩 모델 로드 완료: {self.model_name} (백엔드={config.EMBEDDING_BACKEND})")
         except Exception as e:
             logger.exception(f"SentenceTransformer 모델 로드 실패: {e}")
             raise
     
-    async def embed_text(self, text: str) -> Optional[List[float]]:
-        """텍스트 임베딩 생성"""
+    async def embed_text(self, text: str) -> Optional[np.ndarray]:
+        """텍스트 임베딩 생성
+        
+        동시에 들어온 요청은 최대 MICRO_BATCH_MAX_SIZE개 또는 MICRO_BATCH_MAX_WAIT_SECONDS
+        동안 모아 한 번의 encode 호출로 처리합니다.
+        """
         if not text or text.isspace():
             logger.warning("임베딩할 텍스트가 비어있습니다.")
             return None
         
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        
+        if len(self._pending) >= MICRO_BATCH_MAX_SIZE:
+            self._flush_pending()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(MICRO_BATCH_MAX_WAIT_SECONDS, self._flush_pending)
+        
+        return await future
+    
+    def _flush_pending(self) -> None:
+        """대기 중인 단건 임베딩 요청을 묶어 인코딩 작업으로 넘김"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        
+        task = asyncio.ensure_future(self._encode_pending(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _encode_pending(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """묶인 요청을 한 번에 인코딩하고 결과를 분배"""
         try:
-            # 임베딩 생성
-            embedding = self.model.encode(text)
-            
-            # numpy 배열을 리스트로 변환
-            if isinstance(embedding, np.ndarray):
-                embedding = embedding.tolist()
-            
-            return embedding
+            embeddings = await self._encode([text for text, _ in batch])
         except Exception as e:
             logger.exception(f"텍스트 임베딩 생성 중 오류: {e}")
-            return None
+            embeddings = None
+        
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(embeddings[i] if embeddings is not None else None)
+    
+    async def _encode(self, texts: List[str]) -> np.ndarray:
+        """스레드 풀에서 인코딩 실행 (정규화된 float32 배열 반환)"""
+        loop = asyncio.get_running_loop()
+        embeddings = await loop.run_in_executor(
+            _EMBED_POOL,
+            functools.partial(
+                self.model.encode,
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False  # INFO 레벨에서 기본으로 켜지는 tqdm 진행률 출력 비활성화
+            )
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
     
-    async def embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
+    async def embed_texts(self, texts: List[str]) -> Optional[np.ndarray]:
         """여러 텍스트 임베딩 생성 (배치 처리)"""
         if not texts:
             logger.warning("임베딩할 텍스트가 없습니다.")
@@ -75,18 +153,20 @@ class SentenceTransformerEmbedding(EmbeddingService):
             return None
         
         try:
-            # 배치 임베딩 생성
-            embeddings = self.model.encode(valid_texts)
-            
-            # numpy 배열을 리스트로 변환
-            if isinstance(embeddings, np.ndarray):
-                embeddings = embeddings.tolist()
-            
-            return embeddings
+            # 배치 임베딩 생성 (정규화된 float32 배열 그대로 유지)
+            return await self._encode(valid_texts)
         except Exception as e:
             logger.exception(f"텍스트 배치 임베딩 생성 중 오류: {e}")
             return None
     
     def get_vector_size(self) -> int:
         """임베딩 벡터 크기 반환"""
-        return self.model.get_sentence_embedding_dimension() 
\ No newline at end of file
+        return self.model.get_sentence_embedding_dimension()
+    
+    def get_tokenizer(self) -> Optional[Any]:
+        """임베딩 모델의 토크나이저 반환"""
+        return getattr(self.model, "tokenizer", None)
+    
+    def get_max_seq_length(self) -> Optional[int]:
+        """임베딩 모델의 최대 입력 토큰 수 반환"""
+        return getattr(self.model, "max_seq_length", None) 
\ No newline at end of file
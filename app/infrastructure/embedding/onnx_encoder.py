@@ -0,0 +1,127 @@
+from typing import List, Optional, Any
+import os
+import json
+import numpy as np
+
+from app.core.logger import get_logger
+
+logger = get_logger("infrastructure.embedding.onnx")
+
+# ORTQuantizer가 저장하는 INT8 모델 파일명
+QUANTIZED_MODEL_FILENAME = "model_quantized.onnx"
+
+class OnnxSentenceEncoder:
+    """ONNX Runtime 기반 INT8 양자화 문장 인코더
+
+    SentenceTransformer와 같은 encode() 인터페이스를 제공하므로
+    SentenceTransformerEmbedding에서 모델 대신 그대로 사용할 수 있습니다.
+    최초 실행 시 모델을 ONNX로 내보내고 동적 INT8 양자화한 결과를 캐시 디렉토리에
+    저장하며, 이후에는 저장된 모델을 바로 로드합니다.
+
+    풀링은 평균 풀링(mean pooling)을 사용합니다. (프로필 기본 임베딩 모델 모두 동일)
+    """
+
+    def __init__(self, model_id: str, cache_dir: str):
+        """
+        Args:
+            model_id: Hugging Face 임베딩 모델 ID
+            cache_dir: 변환된 ONNX 모델을 저장할 디렉토리
+        """
+        # 선택적 의존성: ONNX 백엔드를 사용할 때만 필요
+        try:
+            import onnxruntime as ort
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "ONNX 임베딩 백엔드를 사용하려면 'optimum[onnxruntime]' 패키지를 설치하세요."
+            ) from e
+
+        model_path = os.path.join(cache_dir, QUANTIZED_MODEL_FILENAME)
+        if not os.path.exists(model_path):
+            self._export_quantized(model_id, cache_dir)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(cache_dir)
+        self.max_seq_length = self._load_max_seq_length(model_id)
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=session_options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {node.name for node in self.session.get_inputs()}
+        self._dimension = self.session.get_outputs()[0].shape[-1]
+        logger.info(f"ONNX INT8 임베딩 모델 로드 완료: {model_path} (차원={self._dimension})")
+
+    @staticmethod
+    def _export_quantized(model_id: str, cache_dir: str) -> None:
+        """모델을 ONNX로 내보내고 동적 INT8 양자화"""
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        logger.info(f"ONNX 변환 및 INT8 양자화 시작: {model_id} -> {cache_dir}")
+        os.makedirs(cache_dir, exist_ok=True)
+
+        ort_model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+        ort_model.save_pretrained(cache_dir)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(cache_dir)
+
+        quantizer = ORTQuantizer.from_pretrained(ort_model)
+        quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=cache_dir, quantization_config=quantization_config)
+        logger.info("ONNX 변환 및 INT8 양자화 완료")
+
+    def _load_max_seq_length(self, model_id: str) -> int:
+        """sentence-transformers 설정의 최대 입력 길이 (없으면 토크나이저 한도)"""
+        try:
+            from huggingface_hub import hf_hub_download
+            with open(hf_hub_download(model_id, "sentence_bert_config.json")) as f:
+                return int(json.load(f)["max_seq_length"])
+        except Exception:
+            return int(min(self.tokenizer.model_max_length, 512))
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """임베딩 벡터 차원"""
+        return self._dimension
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: Optional[bool] = None,
+        **kwargs: Any
+    ) -> np.ndarray:
+        """문장 목록을 임베딩 배열로 변환 (입력 순서 유지)"""
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        # 길이순으로 정렬해 배치별 패딩을 최소화한 뒤 원래 순서로 복원
+        order = np.argsort([-len(text) for text in sentences])
+        out = np.empty((len(sentences), self._dimension), dtype=np.float32)
+
+        for start in range(0, len(sentences), batch_size):
+            batch_idx = order[start:start + batch_size]
+            inputs = self.tokenizer(
+                [sentences[i] for i in batch_idx],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            feed = {name: value.astype(np.int64) for name, value in inputs.items() if name in self._input_names}
+            token_embeddings = self.session.run(None, feed)[0]
+
+            # 평균 풀링 (패딩 토큰 제외)
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            out[batch_idx] = pooled
+
+        if normalize_embeddings:
+            out /= np.clip(np.linalg.norm(out, axis=1, keepdims=True), 1e-12, None)
+
+        return out[0] if single else out
@@ -0,0 +1,108 @@
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+import time
+import numpy as np
+
+from app.domain.services.answer_cache import AnswerCache
+from app.core.logger import get_logger
+
+logger = get_logger("infrastructure.embedding.semantic_cache")
+
+class SemanticAnswerCache(AnswerCache):
+    """쿼리 임베딩 유사도 기반 응답 캐시
+
+    정규화된 쿼리 임베딩과 응답을 함께 보관하고, 새 쿼리의 임베딩과 코사인 유사도가
+    임계값 이상인 항목이 있으면 저장된 응답을 반환합니다. 유사도 계산은 미리 할당한
+    (최대 항목 수, 차원) 행렬과의 행렬-벡터 곱 한 번으로 수행합니다.
+    완전히 같은 질문은 쿼리 문자열의 SHA-256 키로 임베딩 없이 바로 조회할 수 있습니다.
+    """
+
+    def __init__(self, vector_size: int, max_entries: int, threshold: float, ttl_seconds: float):
+        """
+        Args:
+            vector_size: 임베딩 벡터 차원
+            max_entries: 최대 보관 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+            ttl_seconds: 항목 유효 시간 (문서가 추가/변경되면 응답이 달라질 수 있으므로 제한)
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+
+        self._matrix = np.zeros((max_entries, vector_size), dtype=np.float32)
+        self._active = np.zeros(max_entries, dtype=bool)
+        # 슬롯 번호 -> (저장 시각, 응답), 순서는 LRU 순서
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._free_slots: List[int] = list(range(max_entries - 1, -1, -1))
+        # 쿼리 키(SHA-256) <-> 슬롯 번호 (완전 일치 조회용)
+        self._slot_by_key: Dict[str, int] = {}
+        self._key_by_slot: Dict[int, str] = {}
+        logger.info(f"시맨틱 응답 캐시 초기화: 최대 {max_entries}개, 임계값={threshold}")
+
+    def get_exact(self, key: str) -> Optional[Dict[str, Any]]:
+        """같은 쿼리 키로 저장된 응답 조회 (없으면 None)"""
+        slot = self._slot_by_key.get(key)
+        if slot is None:
+            return None
+
+        created_at, value = self._entries[slot]
+        if time.monotonic() - created_at > self.ttl_seconds:
+            self._release(slot)
+            return None
+
+        self._entries.move_to_end(slot)
+        logger.debug("완전 일치 캐시 적중")
+        return value
+
+    def get(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """유사한 쿼리에 대한 캐시된 응답 조회 (없으면 None)"""
+        if not self._entries:
+            return None
+
+        similarities = self._matrix @ embedding
+        similarities[~self._active] = -1.0
+        slot = int(np.argmax(similarities))
+        if similarities[slot] < self.threshold:
+            return None
+
+        created_at, value = self._entries[slot]
+        if time.monotonic() - created_at > self.ttl_seconds:
+            self._release(slot)
+            return None
+
+        self._entries.move_to_end(slot)
+        logger.debug(f"시맨틱 캐시 적중: 유사도={similarities[slot]:.4f}")
+        return value
+
+    def put(self, embedding: np.ndarray, value: Dict[str, Any], key: Optional[str] = None) -> None:
+        """쿼리 임베딩과 응답 저장 (key가 있으면 완전 일치 조회에도 등록)"""
+        if key is not None and key in self._slot_by_key:
+            self._release(self._slot_by_key[key])
+
+        if not self._free_slots:
+            # 가장 오래 사용하지 않은 항목의 슬롯 재사용
+            oldest_slot = next(iter(self._entries))
+            self._release(oldest_slot)
+
+        slot = self._free_slots.pop()
+        self._matrix[slot] = embedding
+        self._active[slot] = True
+        self._entries[slot] = (time.monotonic(), value)
+        if key is not None:
+            self._slot_by_key[key] = slot
+            self._key_by_slot[slot] = key
+
+    def clear(self) -> None:
+        """모든 항목 제거 (문서 인덱스가 바뀌어 기존 응답이 달라질 수 있을 때 사용)"""
+        for slot in list(self._entries):
+            self._release(slot)
+        logger.info("응답 캐시 초기화")
+
+    def _release(self, slot: int) -> None:
+        """슬롯 비우기"""
+        del self._entries[slot]
+        self._active[slot] = False
+        self._free_slots.append(slot)
+        key = self._key_by_slot.pop(slot, None)
+        if key is not None:
+            del self._slot_by_key[key]
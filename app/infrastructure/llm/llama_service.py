@@ -1,9 +1,12 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 import os
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
-
-from ctransformers import AutoModelForCausalLM
+from cachetools import LRUCache
 
 from app.domain.services.llm_service import LLMService
 from app.core.config import AppConfig
@@ -11,6 +14,11 @@ from app.core.logger import get_logger
 
 logger = get_logger("infrastructure.llm.llama_service")
 
+# 모델 추론 전용 단일 스레드 풀 (모델 상태를 공유하므로 생성 요청은 순차 실행)
+_GEN_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm")
+# 토큰 수를 보관할 최대 텍스트 수 (자주 검색되는 청크의 반복 토큰화 방지)
+TOKEN_COUNT_CACHE_SIZE = 8192
+
 class LlamaService(LLMService):
     """
     LLaMA 모델을 사용하는 LLM 서비스 구현체
@@ -25,6 +33,7 @@ class LlamaService(LLMService):
         self.config = config
         self.model_path = config.MODEL_PATH
         self.model = None
+        self._token_count_cache: LRUCache = LRUCache(maxsize=TOKEN_COUNT_CACHE_SIZE)
         self._load_model()
         logger.info(f"LlamaService 초기화 완료: {self.model_path}")
     
@@ -38,13 +47,17 @@ class LlamaService(LLMService):
             raise FileNotFoundError(error_msg)
         
         try:
+            # 무거운 런타임 import는 모델을 실제로 로드할 때까지 지연
+            from ctransformers import AutoModelForCausalLM
+            
             logger.info(f"모델 로딩 시작: {self.model_path}")
             self.model = AutoModelForCausalLM.from_pretrained(
                 self.model_path,
                 model_type="llama",
-                context_length=2048,  # 컨텍스트 길이 (문서 길이가 길 경우 조정 필요)
+                context_length=self.config.CT_CONTEXT_LENGTH,  # 컨텍스트 길이 (프로필 설정)
+                batch_size=self.config.CT_BATCH_SIZE,  # 프롬프트 처리(prefill) 배치 크기
                 threads=int(os.getenv("OMP_NUM_THREADS", "1")),  # 스레드 수
-                gpu_layers=0  # GPU 사용하지 않음 (CPU 모드)
+                gpu_layers=self.config.GPU_LAYERS  # GPU로 오프로드할 레이어 수 (0이면 CPU 모드)
             )
             logger.info("모델 로딩 완료")
         except Exception as e:
@@ -71,6 +84,9 @@ class LlamaService(LLMService):
             
         Returns:
             생성된 텍스트
+            
+        Raises:
+            RuntimeError: 텍스트 생성 실패 시
         """
         if self.model is None:
             logger.warning("모델이 로드되지 않았습니다. 다시 로드합니다.")
@@ -82,25 +98,125 @@ class LlamaService(LLMService):
             # 모델에 제공할 스톱 토큰 설정
             stop_tokens = stop or []
             
-            # 텍스트 생성
-            generated_text = self.model(
-                prompt,
-                max_new_tokens=max_tokens,
-                temperature=temperature,
-                top_p=top_p,
-                stop=stop_tokens,
-                stream=False  # 스트리밍 비활성화
+            # 텍스트 생성 (이벤트 루프를 막지 않도록 추론 스레드에서 실행)
+            loop = asyncio.get_running_loop()
+            generated_text = await loop.run_in_executor(
+                _GEN_POOL,
+                functools.partial(
+                    self.model,
+                    prompt,
+                    max_new_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    stop=stop_tokens,
+                    stream=False,  # 스트리밍 비활성화
+                    reset=True  # 이전 컨텍스트 초기화 (새로 생성된 토큰만 반환)
+                )
             )
             
-            # 프롬프트 제거 (모델에 따라 프롬프트가 출력에 포함될 수 있음)
-            result = generated_text.replace(prompt, "", 1)
+            # 안전장치: 출력이 프롬프트로 시작하는 경우에만 앞부분 제거 (전체 문자열 탐색 없음)
+            result = generated_text[len(prompt):] if generated_text.startswith(prompt) else generated_text
             
             logger.debug(f"생성 완료: 길이={len(result)}")
             return result.strip()
             
         except Exception as e:
+            # 오류 문구를 응답처럼 반환하면 호출자가 정상 응답과 구분할 수 없으므로 예외로 전달
             logger.exception(f"텍스트 생성 중 오류 발생: {e}")
-            return f"텍스트 생성 중 오류가 발생했습니다: {str(e)}"
+            raise RuntimeError(f"텍스트 생성 실패: {e}") from e
+    
+    async def generate_stream(
+        self, 
+        prompt: str, 
+        max_tokens: int = 512, 
+        temperature: float = 0.7,
+        top_p: float = 0.95,
+        stop: Optional[List[str]] = None
+    ) -> AsyncIterator[str]:
+        """
+        주어진 프롬프트를 기반으로 텍스트를 토큰 단위로 스트리밍 생성합니다.
+        
+        모델의 동기 제너레이터는 스레드 풀에서 실행하고, 생성된 토큰은
+        큐를 통해 이벤트 루프로 전달합니다.
+        
+        Args:
+            prompt: 생성의 기반이 되는 프롬프트 텍스트
+            max_tokens: 생성할 최대 토큰 수
+            temperature: 생성 다양성 조절 파라미터
+            top_p: 확률 분포에서 상위 p%의 토큰만 샘플링
+            stop: 생성을 중지할 토큰 목록
+            
+        Yields:
+            생성된 텍스트 조각
+        """
+        if self.model is None:
+            logger.warning("모델이 로드되지 않았습니다. 다시 로드합니다.")
+            self._load_model()
+        
+        logger.debug(f"스트리밍 생성 시작: 토큰 수={max_tokens}, 온도={temperature}")
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        cancelled = threading.Event()
+        
+        def produce():
+            try:
+                for token in self.model(
+                    prompt,
+                    max_new_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    stop=stop or [],
+                    stream=True,
+                    reset=True
+                ):
+                    # 소비자가 중단(클라이언트 연결 종료 등)하면 생성도 중단
+                    if cancelled.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, token)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+        
+        producer = loop.run_in_executor(_GEN_POOL, produce)
+        
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    logger.exception(f"스트리밍 생성 중 오류 발생: {item}")
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            await producer
+    
+    async def count_tokens(self, text: str) -> Optional[int]:
+        """
+        모델 토크나이저 기준 텍스트의 토큰 수를 반환합니다.
+        
+        ctransformers 모델은 스레드 안전하지 않으므로 토큰화도 생성과 같은
+        추론 스레드에서 실행합니다. 결과는 텍스트별로 캐시합니다.
+        
+        Args:
+            text: 토큰 수를 셀 텍스트
+            
+        Returns:
+            토큰 수 (모델이 로드되지 않았으면 None)
+        """
+        if self.model is None:
+            return None
+        count = self._token_count_cache.get(text)
+        if count is None:
+            loop = asyncio.get_running_loop()
+            tokens = await loop.run_in_executor(_GEN_POOL, self.model.tokenize, text)
+            count = len(tokens)
+            self._token_count_cache[text] = count
+        return count
     
     async def get_model_info(self) -> Dict[str, Any]:
         """
@@ -115,6 +231,6 @@ class LlamaService(LLMService):
             "model_name": model_filename,
             "model_path": self.model_path,
             "model_type": "llama",
-            "context_length": 2048,
+            "context_length": self.config.CT_CONTEXT_LENGTH,
             "loaded": self.model is not None
         } 
\ No newline at end of file
@@ -1,13 +1,23 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import logging
 
 from app.domain.services.rag_service import RAGService
-from app.infrastructure.llm.llm_service import LLMService
+from app.domain.services.llm_service import LLMService
 from app.core.config import AppConfig
 from app.core.logger import get_logger
 
 logger = get_logger("infrastructure.rag.llama_rag_service")
 
+SYSTEM_PROMPT = """당신은 한국어 문서 질의응답 도우미입니다. 
+주어진 컨텍스트 정보를 바탕으로 질문에 정확하게 답변해 주세요.
+컨텍스트에 관련 정보가 없다면, 알지 못한다고 솔직히 답변하세요.
+답변은 간결하고 명확하게 작성하세요."""
+
+NO_CONTEXT_TEXT = "관련 정보가 없습니다."
+CONTEXT_SEPARATOR = "\n\n"
+QUESTION_PREFIX = "\n\n질문: "
+ANSWER_PREFIX = "\n\n답변:"
+
 class LlamaRAGService(RAGService):
     """
     LLaMA 모델을 사용하는 RAG 서비스 구현체
@@ -21,6 +31,10 @@ class LlamaRAGService(RAGService):
         """
         self.llm_service = llm_service
         self.config = config
+        # 요청마다 바뀌지 않는 프롬프트 앞부분은 한 번만 만들어 둠
+        self._prompt_prefix = f"{SYSTEM_PROMPT}\n\n컨텍스트 정보:\n"
+        self.context_length = config.CT_CONTEXT_LENGTH
+        self.max_context_tokens = config.MAX_CONTEXT_TOKENS
         logger.info("LlamaRAGService 초기화 완료")
     
     async def generate_answer(
@@ -41,18 +55,12 @@ class LlamaRAGService(RAGService):
             
         Returns:
             생성된 응답 텍스트
+            
+        Raises:
+            RuntimeError: 응답 생성 실패 시 (실패 문구를 응답으로 반환하지 않음)
         """
         try:
-            # 시스템 프롬프트 가져오기
-            system_prompt = await self.get_system_prompt()
-            
-            # 컨텍스트 텍스트 결합
-            context_text = "\n\n".join(context) if context else "관련 정보가 없습니다."
-            
-            # 전체 프롬프트 형성
-            full_prompt = f"{system_prompt}\n\n컨텍스트 정보:\n{context_text}\n\n질문: {query}\n\n답변:"
-            
-            logger.debug(f"생성 프롬프트: {full_prompt[:100]}...")
+            full_prompt = await self._build_prompt(query, context, max_tokens)
             
             # LLM을 사용하여 응답 생성
             response = await self.llm_service.generate(
@@ -65,7 +73,80 @@ class LlamaRAGService(RAGService):
             
         except Exception as e:
             logger.exception(f"응답 생성 중 오류 발생: {e}")
-            return f"응답 생성 중 오류가 발생했습니다: {str(e)}"
+            raise RuntimeError(f"응답 생성 실패: {e}") from e
+    
+    async def generate_answer_stream(
+        self, 
+        query: str, 
+        context: List[str], 
+        max_tokens: int = 512, 
+        temperature: float = 0.7
+    ) -> AsyncIterator[str]:
+        """
+        주어진 쿼리와 검색된 컨텍스트를 기반으로 응답을 스트리밍 생성합니다.
+        
+        Args:
+            query: 사용자 질의
+            context: 관련 문서 컨텍스트 목록
+            max_tokens: 생성할 최대 토큰 수 (기본값: 512)
+            temperature: 생성 다양성 조절 파라미터 (기본값: 0.7)
+            
+        Yields:
+            생성된 응답 텍스트 조각
+        """
+        full_prompt = await self._build_prompt(query, context, max_tokens)
+        
+        async for token in self.llm_service.generate_stream(
+            prompt=full_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        ):
+            yield token
+    
+    async def _build_prompt(self, query: str, context: List[str], max_tokens: int) -> str:
+        """미리 만들어 둔 프롬프트 앞부분에 컨텍스트와 질문을 결합하여 전체 프롬프트 생성"""
+        context = await self.fit_context(query, context, max_tokens)
+        context_text = CONTEXT_SEPARATOR.join(context) if context else NO_CONTEXT_TEXT
+        
+        # 전체 프롬프트를 한 번의 join으로 형성
+        full_prompt = "".join((self._prompt_prefix, context_text, QUESTION_PREFIX, query, ANSWER_PREFIX))
+        
+        logger.debug(f"생성 프롬프트: {full_prompt[:100]}...")
+        return full_prompt
+    
+    async def fit_context(self, query: str, context: List[str], max_tokens: int = 512) -> List[str]:
+        """컨텍스트를 관련도 순서대로 모델 컨텍스트 길이에 맞는 만큼만 사용
+        
+        예산 = CT_CONTEXT_LENGTH - 생성 토큰 수 - (프롬프트 고정 부분 + 질문) 토큰 수이며,
+        MAX_CONTEXT_TOKENS가 양수이면 이를 상한으로 적용합니다.
+        첫 번째 컨텍스트는 예산을 넘더라도 항상 포함합니다.
+        """
+        overhead = await self.llm_service.count_tokens(
+            "".join((self._prompt_prefix, QUESTION_PREFIX, query, ANSWER_PREFIX))
+        )
+        separator_tokens = await self.llm_service.count_tokens(CONTEXT_SEPARATOR)
+        if overhead is None or separator_tokens is None:
+            # 토큰 수를 알 수 없으면 자르지 않음
+            return context
+        
+        budget = self.context_length - max_tokens - overhead
+        if self.max_context_tokens > 0:
+            budget = min(budget, self.max_context_tokens)
+        
+        fitted = []
+        total_tokens = 0
+        for text in context:
+            tokens = await self.llm_service.count_tokens(text)
+            if tokens is None:
+                return context
+            if fitted:
+                tokens += separator_tokens
+                if total_tokens + tokens > budget:
+                    logger.debug(f"컨텍스트 토큰 예산({budget}) 초과로 {len(context) - len(fitted)}개 컨텍스트 제외")
+                    break
+            fitted.append(text)
+            total_tokens += tokens
+        return fitted
     
     async def get_system_prompt(self) -> str:
         """
@@ -74,10 +155,7 @@ class LlamaRAGService(RAGService):
         Returns:
             시스템 프롬프트 텍스트
         """
-        return """당신은 한국어 문서 질의응답 도우미입니다. 
-주어진 컨텍스트 정보를 바탕으로 질문에 정확하게 답변해 주세요.
-컨텍스트에 관련 정보가 없다면, 알지 못한다고 솔직히 답변하세요.
-답변은 간결하고 명확하게 작성하세요."""
+        return SYSTEM_PROMPT
     
     async def format_retrieval_context(self, context_items: List[Dict[str, Any]]) -> str:
         """
@@ -90,7 +168,7 @@ class LlamaRAGService(RAGService):
             포맷팅된 컨텍스트 문자열
         """
         if not context_items:
-            return "관련 정보가 없습니다."
+            return NO_CONTEXT_TEXT
         
         formatted_contexts = []
         
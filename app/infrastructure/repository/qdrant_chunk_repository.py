@@ -1,6 +1,9 @@
 from typing import List, Dict, Any, Optional
 import uuid
 import asyncio
+import functools
+import numpy as np
+from cachetools import LRUCache
 from qdrant_client import QdrantClient 
 from qdrant_client.http import models as qdrant_models
 from qdrant_client.http.exceptions import UnexpectedResponse
@@ -9,11 +12,29 @@ from app.domain.value_objects.document_chunk import DocumentChunk
 from app.domain.value_objects.search_query import SearchQuery
 from app.domain.repositories.chunk_repository import ChunkRepository
 from app.infrastructure.embedding.embedding_service import EmbeddingService
+from app.infrastructure.embedding.embedding_cache import EmbeddingCache
 from app.core.logger import get_logger
 from app.core.config import AppConfig
 
 logger = get_logger("infrastructure.repository.qdrant_chunk")
 
+# scroll 한 페이지당 가져올 포인트 수
+SCROLL_PAGE_SIZE = 512
+# upsert 요청 한 번에 보내는 최대 포인트 수 (대용량 문서의 요청 크기 제한)
+UPSERT_BATCH_SIZE = 256
+# 반복 검색어의 임베딩을 보관할 최대 쿼리 수
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+# 청크 포인트 ID 생성을 위한 UUID 네임스페이스 (변경 시 기존 포인트와 ID가 달라짐)
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c2b7e-3d4a-5b8c-9e0f-a1b2c3d4e5f6")
+
+def make_chunk_point_id(chunk: DocumentChunk) -> str:
+    """문서 ID/페이지/인덱스로부터 결정적인 포인트 ID 생성
+    
+    같은 청크는 항상 같은 ID를 가지므로 재인덱싱 시 기존 포인트를 덮어씁니다.
+    """
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{chunk.document_id}:{chunk.index}:{chunk.page}"))
+
 class QdrantChunkRepository(ChunkRepository):
     """Qdrant 기반 청크 저장소 구현체
     
@@ -24,32 +45,76 @@ class QdrantChunkRepository(ChunkRepository):
     def __init__(self, 
                  client: QdrantClient, 
                  embedding_service: EmbeddingService,
-                 config: AppConfig):
+                 config: AppConfig,
+                 embedding_cache: Optional[EmbeddingCache] = None):
         self.client = client
         self.embedding_service = embedding_service
+        self.embedding_cache = embedding_cache
         self.collection_name = config.QDRANT_COLLECTION_NAME
         self.vector_size = embedding_service.get_vector_size()
+        self.scalar_quantization = config.QDRANT_SCALAR_QUANTIZATION
+        self.float16_vectors = config.QDRANT_FLOAT16_VECTORS
+        self.vectors_on_disk = config.QDRANT_VECTORS_ON_DISK and config.QDRANT_SCALAR_QUANTIZATION
+        self.quantization_oversampling = config.QDRANT_QUANTIZATION_OVERSAMPLING
+        self.hnsw_config = qdrant_models.HnswConfigDiff(
+            m=config.QDRANT_HNSW_M,
+            ef_construct=config.QDRANT_HNSW_EF_CONSTRUCT,
+            full_scan_threshold=config.QDRANT_HNSW_FULL_SCAN_THRESHOLD
+        )
+        self.hnsw_ef = config.QDRANT_HNSW_EF
+        # 쿼리 임베딩 LRU 캐시 (같은 모델에서 임베딩은 결정적이므로 재사용 가능)
+        self._query_embedding_cache: LRUCache = LRUCache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
         
-        # 콜렉션 초기화 보장
-        asyncio.create_task(self._ensure_collection())
+        # 콜렉션 초기화는 첫 호출 시 한 번만 수행 (lazy-once)
+        self._ready = asyncio.Event()
+        self._init_lock = asyncio.Lock()
         logger.info(f"Qdrant 청크 저장소 초기화: 콜렉션={self.collection_name}")
     
-    async def _ensure_collection(self):
-        """콜렉션이 존재하는지 확인하고, 없으면 생성"""
+    async def _ensure_ready(self) -> None:
+        """콜렉션 초기화가 완료되었는지 보장 (동시 호출 시에도 한 번만 실행)"""
+        if self._ready.is_set():
+            return
+        
+        async with self._init_lock:
+            if self._ready.is_set():
+                return
+            if await self._ensure_collection():
+                self._ready.set()
+    
+    async def _ensure_collection(self) -> bool:
+        """콜렉션이 존재하는지 확인하고, 없으면 생성
+        
+        Returns:
+            bool: 콜렉션 사용 가능 여부
+        """
         try:
-            collections = self.client.get_collections().collections
-            collection_names = [collection.name for collection in collections]
-            
-            if self.collection_name not in collection_names:
+            if not self.client.collection_exists(self.collection_name):
                 logger.info(f"Qdrant 콜렉션 생성: {self.collection_name}")
                 
+                # int8 스칼라 양자화 설정 (벡터 메모리/대역폭 약 1/4로 감소)
+                quantization_config = None
+                if self.scalar_quantization:
+                    quantization_config = qdrant_models.ScalarQuantization(
+                        scalar=qdrant_models.ScalarQuantizationConfig(
+                            type=qdrant_models.ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True
+                        )
+                    )
+                
                 # 콜렉션 생성
                 self.client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=qdrant_models.VectorParams(
                         size=self.vector_size,
-                        distance=qdrant_models.Distance.COSINE
-                    )
+                        distance=qdrant_models.Distance.COSINE,
+                        # 원본 벡터를 float16으로 저장하여 재채점 시 읽는 메모리 절반으로 감소
+                        datatype=qdrant_models.Datatype.FLOAT16 if self.float16_vectors else None,
+                        # 양자화 벡터만 RAM에 두고 원본 벡터는 디스크(mmap)에 보관 (재채점 시에만 읽음)
+                        on_disk=self.vectors_on_disk or None
+                    ),
+                    hnsw_config=self.hnsw_config,
+                    quantization_config=quantization_config
                 )
                 
                 # 청크 메타데이터를 위한 페이로드 인덱스 생성
@@ -65,100 +130,178 @@ class QdrantChunkRepository(ChunkRepository):
                 )
             else:
                 logger.debug(f"Qdrant 콜렉션 이미 존재함: {self.collection_name}")
+            
+            return True
                 
         except Exception as e:
             logger.exception(f"Qdrant 콜렉션 초기화 중 오류: {e}")
+            return False
+    
+    async def _embed_with_cache(self, texts: List[str]) -> Optional[np.ndarray]:
+        """중복 텍스트를 제거하고 캐시에 없는 텍스트만 임베딩한 뒤 원래 순서로 결합"""
+        # 반복되는 머리글/바닥글 등 동일 텍스트는 한 번만 임베딩
+        positions: Dict[str, int] = {}
+        unique_texts: List[str] = []
+        for text in texts:
+            if text not in positions:
+                positions[text] = len(unique_texts)
+                unique_texts.append(text)
+        inverse = [positions[text] for text in texts]
+        
+        if self.embedding_cache is None:
+            unique_embeddings = await self.embedding_service.embed_texts(unique_texts)
+            if unique_embeddings is None or len(unique_embeddings) != len(unique_texts):
+                return None
+            return unique_embeddings[inverse]
+        
+        keys = [self.embedding_cache.make_key(text) for text in unique_texts]
+        cached = self.embedding_cache.get_many(keys)
+        
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        logger.debug(f"임베딩 캐시 조회: 전체 {len(texts)}개, 고유 {len(unique_texts)}개, 적중 {len(unique_texts) - len(missing)}개")
+        
+        new_embeddings = None
+        if missing:
+            new_embeddings = await self.embedding_service.embed_texts([unique_texts[i] for i in missing])
+            if new_embeddings is None or len(new_embeddings) != len(missing):
+                return None
+            self.embedding_cache.put_many(zip((keys[i] for i in missing), new_embeddings))
+        
+        # 고유 텍스트 순서로 결과 배열 구성 후 원래 순서로 펼침
+        unique_embeddings = np.empty((len(unique_texts), self.vector_size), dtype=np.float32)
+        for i, key in enumerate(keys):
+            if key in cached:
+                unique_embeddings[i] = cached[key]
+        if new_embeddings is not None:
+            unique_embeddings[missing] = new_embeddings
+        return unique_embeddings[inverse]
     
     async def save_chunks(self, chunks: List[DocumentChunk]) -> bool:
-        """청크 저장 (일괄 처리)"""
+        """청크 저장 (일괄 처리)
+        
+        UPSERT_BATCH_SIZE 단위로 나누어, 이전 배치를 Qdrant에 업로드하는 동안
+        다음 배치의 임베딩을 생성합니다.
+        """
         if not chunks:
             logger.warning("저장할 청크가 없습니다.")
             return False
         
+        upload_task: Optional[asyncio.Task] = None
         try:
-            # 텍스트 리스트 추출
-            texts = [chunk.text for chunk in chunks]
-            
-            # 임베딩 생성
-            embeddings = await self.embedding_service.embed_texts(texts)
-            if not embeddings or len(embeddings) != len(chunks):
-                logger.error(f"임베딩 생성 실패: 텍스트 {len(texts)}개, 임베딩 {len(embeddings) if embeddings else 0}개")
-                return False
-            
-            # Qdrant에 저장할 포인트 생성
-            points = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                point_id = str(uuid.uuid4())
-                
-                # 페이로드 생성 (메타데이터)
-                payload = {
-                    "text": chunk.text,
-                    "source": chunk.source,
-                    "document_id": chunk.document_id
-                }
-                
-                # 페이지 번호가 있으면 추가
-                if chunk.page is not None:
-                    payload["page"] = chunk.page
+            await self._ensure_ready()
+            
+            for start in range(0, len(chunks), UPSERT_BATCH_SIZE):
+                batch = chunks[start:start + UPSERT_BATCH_SIZE]
                 
-                # 인덱스가 있으면 추가
-                if chunk.index is not None:
-                    payload["index"] = chunk.index
+                # 임베딩 생성 (캐시에 있는 텍스트는 재계산하지 않음)
+                embeddings = await self._embed_with_cache([chunk.text for chunk in batch])
+                if embeddings is None or len(embeddings) != len(batch):
+                    logger.error(f"임베딩 생성 실패: 텍스트 {len(batch)}개, 임베딩 {len(embeddings) if embeddings is not None else 0}개")
+                    return False
                 
-                # 포인트 생성
-                points.append(qdrant_models.PointStruct(
-                    id=point_id,
-                    vector=embedding,
-                    payload=payload
-                ))
-            
-            # Qdrant에 포인트 저장
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
-            )
+                # 이전 배치 업로드가 끝난 뒤 현재 배치 업로드 시작
+                if upload_task is not None:
+                    await upload_task
+                # 마지막 배치만 적용 완료까지 대기 (업데이트는 순서대로 적용되므로
+                # 마지막 배치가 끝나면 앞선 배치도 모두 반영된 상태)
+                is_last = start + UPSERT_BATCH_SIZE >= len(chunks)
+                upload_task = asyncio.create_task(self._upsert_batch(batch, embeddings, wait=is_last))
+            
+            await upload_task
+            upload_task = None
             
-            logger.info(f"Qdrant에 {len(points)}개 청크 저장 완료: 문서 ID={chunks[0].document_id}")
+            logger.info(f"Qdrant에 {len(chunks)}개 청크 저장 완료: 문서 ID={chunks[0].document_id}")
             return True
             
         except Exception as e:
             logger.exception(f"청크 저장 중 오류: {e}")
             return False
+        finally:
+            # 실패로 빠져나온 경우 진행 중인 업로드를 마무리
+            if upload_task is not None and not upload_task.done():
+                await asyncio.gather(upload_task, return_exceptions=True)
     
-    async def find_by_document_id(self, document_id: str) -> List[DocumentChunk]:
-        """문서 ID로 청크 검색"""
-        try:
-            # 문서 ID로 필터링
-            search_result = self.client.scroll(
+    async def _upsert_batch(self, chunks: List[DocumentChunk], embeddings: np.ndarray, wait: bool = True) -> None:
+        """청크 배치를 Qdrant에 저장 (동기 클라이언트 호출은 스레드 풀에서 실행)
+        
+        Args:
+            chunks: 저장할 청크 배치
+            embeddings: 청크 순서와 같은 임베딩 배열
+            wait: False이면 서버가 요청을 접수(WAL 기록)하는 즉시 반환
+        """
+        # Qdrant에 저장할 ID/페이로드 생성 (page/index는 없으면 None으로 저장)
+        ids = [make_chunk_point_id(chunk) for chunk in chunks]
+        payloads = [
+            {
+                "text": chunk.text,
+                "source": chunk.source,
+                "document_id": chunk.document_id,
+                "page": chunk.page,
+                "index": chunk.index
+            }
+            for chunk in chunks
+        ]
+        
+        # upload_collection은 numpy 배열을 그대로 받아 배치 전송/재시도를 처리
+        # (호출당 배치가 작아 워커 프로세스를 띄우는 비용이 더 크므로 단일 프로세스로 전송)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.client.upload_collection,
                 collection_name=self.collection_name,
-                scroll_filter=qdrant_models.Filter(
-                    must=[
-                        qdrant_models.FieldCondition(
-                            key="document_id",
-                            match=qdrant_models.MatchValue(value=document_id)
-                        )
-                    ]
-                ),
-                limit=100  # 최대 100개 청크 반환 (필요에 따라 조정)
+                vectors=embeddings,
+                payload=payloads,
+                ids=ids,
+                batch_size=UPSERT_BATCH_SIZE,
+                wait=wait
             )
+        )
+    
+    async def find_by_document_id(self, document_id: str) -> List[DocumentChunk]:
+        """문서 ID로 청크 검색 (페이지 단위로 전체 스크롤, 벡터는 받지 않음)"""
+        try:
+            await self._ensure_ready()
             
-            # 결과가 없으면 빈 리스트 반환
-            if not search_result or not search_result.points:
-                logger.debug(f"문서 ID에 해당하는 청크 없음: {document_id}")
-                return []
+            scroll_filter = qdrant_models.Filter(
+                must=[
+                    qdrant_models.FieldCondition(
+                        key="document_id",
+                        match=qdrant_models.MatchValue(value=document_id)
+                    )
+                ]
+            )
             
-            # 청크 생성
+            # 다음 페이지가 없을 때까지 스크롤 (문서 크기 제한 없음)
             chunks = []
-            for point in search_result.points:
-                payload = point.payload
+            offset = None
+            while True:
+                points, offset = self.client.scroll(
+                    collection_name=self.collection_name,
+                    scroll_filter=scroll_filter,
+                    limit=SCROLL_PAGE_SIZE,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
                 
-                chunks.append(DocumentChunk(
-                    text=payload.get("text", ""),
-                    source=payload.get("source", ""),
-                    document_id=payload.get("document_id", ""),
-                    page=payload.get("page"),
-                    index=payload.get("index")
-                ))
+                for point in points:
+                    payload = point.payload
+                    
+                    chunks.append(DocumentChunk(
+                        text=payload.get("text", ""),
+                        source=payload.get("source", ""),
+                        document_id=payload.get("document_id", ""),
+                        page=payload.get("page"),
+                        index=payload.get("index")
+                    ))
+                
+                if offset is None:
+                    break
+            
+            if not chunks:
+                logger.debug(f"문서 ID에 해당하는 청크 없음: {document_id}")
+                return []
             
             logger.debug(f"문서 ID로 {len(chunks)}개 청크 조회: {document_id}")
             return chunks
@@ -170,6 +313,8 @@ class QdrantChunkRepository(ChunkRepository):
     async def delete_by_document_id(self, document_id: str) -> bool:
         """문서 ID로 청크 삭제"""
         try:
+            await self._ensure_ready()
+            
             # 문서 ID로 포인트 삭제
             self.client.delete(
                 collection_name=self.collection_name,
@@ -192,12 +337,28 @@ class QdrantChunkRepository(ChunkRepository):
             logger.exception(f"문서 ID로 청크 삭제 중 오류: {e}")
             return False
     
+    async def _embed_query(self, text: str) -> Optional[np.ndarray]:
+        """쿼리 임베딩 생성 (앞뒤 공백을 제거한 텍스트를 키로 LRU 캐시)"""
+        key = text.strip()
+        embedding = self._query_embedding_cache.get(key)
+        if embedding is not None:
+            return embedding
+        
+        embedding = await self.embedding_service.embed_text(key)
+        if embedding is not None:
+            # 캐시된 배열이 호출자에 의해 변경되지 않도록 읽기 전용으로 보관
+            embedding.setflags(write=False)
+            self._query_embedding_cache[key] = embedding
+        return embedding
+    
     async def search(self, query: SearchQuery) -> List[Dict[str, Any]]:
         """의미적 유사도 기반 청크 검색"""
         try:
-            # 쿼리 텍스트 임베딩
-            query_embedding = await self.embedding_service.embed_text(query.text)
-            if not query_embedding:
+            await self._ensure_ready()
+            
+            # 쿼리 텍스트 임베딩 (미리 계산된 값이 있으면 사용, 반복 검색어는 캐시 재사용)
+            query_embedding = await self._query_vector(query)
+            if query_embedding is None:
                 logger.error("쿼리 임베딩 생성 실패")
                 return []
             
@@ -205,34 +366,56 @@ class QdrantChunkRepository(ChunkRepository):
             search_result = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
+                search_params=self._search_params(),
                 limit=query.top_k
             )
             
-            # 결과 변환
-            results = []
-            for point in search_result:
-                payload = point.payload
-                
-                result = {
-                    "text": payload.get("text", ""),
-                    "source": payload.get("source", ""),
-                    "document_id": payload.get("document_id", ""),
-                    "score": point.score
-                }
-                
-                # 페이지 번호가 있으면 추가
-                if "page" in payload:
-                    result["page"] = payload["page"]
-                
-                # 인덱스가 있으면 추가
-                if "index" in payload:
-                    result["index"] = payload["index"]
-                
-                results.append(result)
-            
+            results = [self._to_result(point) for point in search_result]
             logger.debug(f"쿼리 검색 결과: {len(results)}개 청크, 쿼리='{query.text[:50]}...'")
             return results
             
         except Exception as e:
             logger.exception(f"청크 검색 중 오류: {e}")
-            return [] 
\ No newline at end of file
+            return []
+    
+    async def _query_vector(self, query: SearchQuery) -> Optional[np.ndarray]:
+        """쿼리의 임베딩 반환 (미리 계산된 값 우선)"""
+        if query.embedding is not None:
+            return query.embedding
+        return await self._embed_query(query.text)
+    
+    def _search_params(self) -> qdrant_models.SearchParams:
+        """HNSW 탐색 폭 지정, 양자화 사용 시 양자화된 벡터로 후보를 찾고 원본 벡터로 재채점"""
+        quantization_params = None
+        if self.scalar_quantization:
+            quantization_params = qdrant_models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=self.quantization_oversampling
+            )
+        return qdrant_models.SearchParams(
+            hnsw_ef=self.hnsw_ef,
+            exact=False,
+            quantization=quantization_params
+        )
+    
+    @staticmethod
+    def _to_result(point) -> Dict[str, Any]:
+        """검색된 포인트를 결과 딕셔너리로 변환"""
+        payload = point.payload
+        
+        result = {
+            "text": payload.get("text", ""),
+            "source": payload.get("source", ""),
+            "document_id": payload.get("document_id", ""),
+            "score": point.score
+        }
+        
+        # 페이지 번호가 있으면 추가
+        if "page" in payload:
+            result["page"] = payload["page"]
+        
+        # 인덱스가 있으면 추가
+        if "index" in payload:
+            result["index"] = payload["index"]
+        
+        return result 
\ No newline at end of file
@@ -1,7 +1,7 @@
 import os
 import shutil
 import uuid
-from typing import Tuple
+from typing import Tuple, Union, AsyncIterable
 import aiofiles
 
 from app.domain.services.storage_service import StorageService
@@ -28,13 +28,13 @@ class LocalStorageService(StorageService):
         os.makedirs(self.storage_path, exist_ok=True)
         logger.info(f"로컬 저장소 초기화 완료: {self.storage_path}")
     
-    async def save_file(self, file_content: bytes, filename: str) -> Tuple[str, str]:
+    async def save_file(self, file_content: Union[bytes, AsyncIterable[bytes]], filename: str) -> Tuple[str, str]:
         """
         파일을 로컬 저장소에 저장합니다.
         
         Args:
-            file_content: 파일 내용 (바이트)
-            filename:
+            file_content: 파일 내용 (바이트 또는 바이트 청크 스트림)
+            filename: 원본 파일명
             
         Returns:
             Tuple[str, str]: 파일 경로와 원본 파일명
@@ -49,9 +49,13 @@ class LocalStorageService(StorageService):
             # 전체 파일 경로
             file_path = os.path.join(self.storage_path, saved_filename)
             
-            # 비동기로 파일 저장
+            # 비동기로 파일 저장 (스트림은 청크 단위로 기록)
             async with aiofiles.open(file_path, "wb") as buffer:
-                await buffer.write(file_content)
+                if isinstance(file_content, (bytes, bytearray, memoryview)):
+                    await buffer.write(file_content)
+                else:
+                    async for chunk in file_content:
+                        await buffer.write(chunk)
             
             logger.info(f"파일 로컬 저장 완료: {file_path}")
             return file_path, filename
@@ -1,7 +1,14 @@
 import os
 import uuid
-from typing import Tuple
-import boto3
+import asyncio
+import random
+import tempfile
+from contextlib import AsyncExitStack
+from typing import Tuple, Union, AsyncIterable, Optional, Any, Callable, Awaitable, List, Dict
+import aioboto3
+from cachetools import LRUCache
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import io
 
@@ -11,6 +18,37 @@ from app.core.logger import get_logger
 
 logger = get_logger("infrastructure.storage.s3")
 
+# 동시 업로드 시 커넥션 풀 고갈을 막기 위한 최대 커넥션 수
+S3_MAX_POOL_CONNECTIONS = 64
+
+# botocore 표준 재시도 모드의 최대 시도 횟수
+S3_MAX_ATTEMPTS = 10
+# 애플리케이션 수준에서 재시도할 S3 오류 코드 (요청 속도 제한/일시적 장애)
+S3_RETRYABLE_ERROR_CODES = {'SlowDown', 'InternalError', 'ServiceUnavailable'}
+S3_RETRY_MAX_ATTEMPTS = 5
+S3_RETRY_BASE_DELAY = 0.1
+S3_RETRY_MAX_DELAY = 20.0
+
+# 읽기 캐시에 넣을 객체의 최대 크기 (큰 객체는 캐시하지 않음)
+S3_CACHE_MAX_ITEM_SIZE = 8 * 1024 * 1024
+
+# DeleteObjects 요청 한 번에 삭제 가능한 최대 키 수
+S3_DELETE_BATCH_SIZE = 1000
+
+# 이 크기 이상일 때만 멀티파트 업로드 사용 (그 미만은 단일 PutObject)
+S3_MULTIPART_THRESHOLD = 16 * 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=S3_MULTIPART_THRESHOLD,
+    multipart_chunksize=64 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+# 병렬 범위 GET의 범위 크기와 동시 요청 수 (이보다 작은 객체는 단일 GET)
+S3_RANGE_CHUNK_SIZE = 8 * 1024 * 1024
+S3_RANGE_CONCURRENCY = 8
+# 스트림 업로드 버퍼가 이 크기를 넘으면 메모리 대신 임시 파일로 전환
+S3_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
 class S3StorageService(StorageService):
     """
     AWS S3 저장소 구현체
@@ -29,22 +67,79 @@ class S3StorageService(StorageService):
             raise ValueError("S3 버킷이 설정되지 않았습니다. S3_BUCKET 환경변수를 확인하세요.")
             
         self.s3_region = config.S3_REGION
+        # 세션과 클라이언트는 한 번만 생성하여 재사용 (서비스 모델 로딩/커넥션 풀 생성 비용 절감)
+        self._session = aioboto3.Session()
+        self._client_config = Config(
+            region_name=self.s3_region,
+            s3={'addressing_style': 'virtual', 'use_accelerate_endpoint': False},  # 경로 방식 리다이렉트 회피
+            tcp_keepalive=True,  # 유휴 커넥션 유지로 TLS 핸드셰이크 재사용
+            connect_timeout=3,
+            read_timeout=30,
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={'mode': 'standard', 'max_attempts': S3_MAX_ATTEMPTS}
+        )
+        self._s3: Optional[Any] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._client_lock = asyncio.Lock()
+        
+        # 자주 읽는 작은 객체용 바이트 크기 기준 LRU 캐시 (단일 프로세스 내에서만 유효)
+        cache_size = config.S3_READ_CACHE_MB * 1024 * 1024
+        self._cache: Optional[LRUCache] = LRUCache(maxsize=cache_size, getsizeof=len) if cache_size > 0 else None
         logger.info(f"S3 저장소 초기화 완료: 버킷={self.s3_bucket}, 리전={self.s3_region}")
     
-    def _get_s3_client(self):
+    async def _get_s3_client(self):
         """
-        S3 클라이언트를 가져옵니다.
+        재사용되는 비동기 S3 클라이언트를 가져옵니다. (최초 호출 시 한 번만 생성)
         
         참고: 실제 환경에서는 보안을 위해 IAM 역할 등을 통한 인증 방식을 고려해야 합니다.
         """
-        return boto3.client('s3', region_name=self.s3_region)
+        if self._s3 is not None:
+            return self._s3
+        
+        async with self._client_lock:
+            if self._s3 is None:
+                exit_stack = AsyncExitStack()
+                self._s3 = await exit_stack.enter_async_context(
+                    self._session.client('s3', region_name=self.s3_region, config=self._client_config)
+                )
+                self._exit_stack = exit_stack
+                logger.debug("S3 클라이언트 생성 완료")
+        return self._s3
     
-    async def save_file(self, file_content: bytes, filename: str) -> Tuple[str, str]:
+    async def close(self) -> None:
+        """
+        S3 클라이언트와 커넥션 풀을 정리합니다.
+        """
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            self._s3 = None
+    
+    async def _call_with_retry(self, operation: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+        """
+        S3 호출을 실행하고, 일시적 오류일 경우 지수 백오프(full jitter)로 재시도합니다.
+        
+        Args:
+            operation: 실행할 S3 클라이언트 메서드
+            **kwargs: 메서드 인자
+        """
+        for attempt in range(S3_RETRY_MAX_ATTEMPTS):
+            try:
+                return await operation(**kwargs)
+            except ClientError as e:
+                code = e.response.get('Error', {}).get('Code')
+                if code not in S3_RETRYABLE_ERROR_CODES or attempt == S3_RETRY_MAX_ATTEMPTS - 1:
+                    raise
+                delay = random.uniform(0, min(S3_RETRY_MAX_DELAY, S3_RETRY_BASE_DELAY * 2 ** attempt))
+                logger.warning(f"S3 일시적 오류({code}), {delay:.2f}초 후 재시도 ({attempt + 1}/{S3_RETRY_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
+    
+    async def save_file(self, file_content: Union[bytes, AsyncIterable[bytes]], filename: str) -> Tuple[str, str]:
         """
         파일을 S3에 저장합니다.
         
         Args:
-            file_content: 파일 내용 (바이트)
+            file_content: 파일 내용 (바이트 또는 바이트 청크 스트림)
             filename: 원본 파일명
             
         Returns:
@@ -55,21 +150,48 @@ class S3StorageService(StorageService):
             file_extension = os.path.splitext(filename)[1].lower()
             # 고유 ID 생성
             unique_id = str(uuid.uuid4())
-            # S3 키 생성
-            s3_key = f"uploads/{unique_id}{file_extension}"
-            
-            # S3 클라이언트 가져오기
-            s3 = self._get_s3_client()
+            # S3 키 생성 (uuid 앞 2자리로 접두사를 분산하여 파티션 핫스팟 방지)
+            shard = unique_id[:2]
+            s3_key = f"uploads/{shard}/{unique_id}{file_extension}"
             
-            # 메모리 버퍼 생성
-            buffer = io.BytesIO(file_content)
+            s3 = await self._get_s3_client()
             
-            # S3에 업로드
-            s3.upload_fileobj(
-                buffer,
-                self.s3_bucket,
-                s3_key
-            )
+            if isinstance(file_content, (bytes, bytearray, memoryview)):
+                content = bytes(file_content)
+                if len(content) < S3_MULTIPART_THRESHOLD:
+                    # 작은 파일은 단일 PutObject 요청으로 업로드 (멀티파트 왕복 생략)
+                    await self._call_with_retry(s3.put_object, Bucket=self.s3_bucket, Key=s3_key, Body=content)
+                else:
+                    await s3.upload_fileobj(
+                        io.BytesIO(content),
+                        self.s3_bucket,
+                        s3_key,
+                        Config=S3_TRANSFER_CONFIG
+                    )
+            else:
+                # 스트림 입력은 작을 때는 메모리, 클 때는 디스크에 버퍼링 (전체를 메모리에 이중으로 두지 않음)
+                with tempfile.SpooledTemporaryFile(max_size=S3_SPOOL_MAX_SIZE) as spool:
+                    size = 0
+                    loop = asyncio.get_running_loop()
+                    async for chunk in file_content:
+                        if spool._rolled or size + len(chunk) > S3_SPOOL_MAX_SIZE:
+                            # 디스크로 넘어간 뒤(또는 넘어가는 쓰기)는 파일 I/O이므로 이벤트 루프 밖에서 실행
+                            await loop.run_in_executor(None, spool.write, chunk)
+                        else:
+                            spool.write(chunk)
+                        size += len(chunk)
+                    spool.seek(0)
+                    
+                    if size < S3_MULTIPART_THRESHOLD:
+                        await self._call_with_retry(s3.put_object, Bucket=self.s3_bucket, Key=s3_key, Body=spool.read())
+                    else:
+                        # 멀티파트 업로드는 5GB PutObject 제한이 없고 파트를 병렬 전송
+                        await s3.upload_fileobj(
+                            spool,
+                            self.s3_bucket,
+                            s3_key,
+                            Config=S3_TRANSFER_CONFIG
+                        )
             
             logger.info(f"파일 S3 업로드 완료: s3://{self.s3_bucket}/{s3_key}")
             return s3_key, filename
@@ -93,19 +215,25 @@ class S3StorageService(StorageService):
         """
         s3_key = identifier  # S3에서는 식별자가 S3 키
         
+        if self._cache is not None:
+            cached = self._cache.get(s3_key)
+            if cached is not None:
+                logger.debug(f"S3 읽기 캐시 적중: {s3_key}")
+                return cached
+        
         try:
-            # S3 클라이언트 가져오기
-            s3 = self._get_s3_client()
+            # S3에서 객체 가져오기 (큰 객체는 범위별 병렬 다운로드)
+            s3 = await self._get_s3_client()
+            content = await self._download_ranges(s3, s3_key)
             
-            # S3에서 객체 가져오기
-            s3_object = s3.get_object(Bucket=self.s3_bucket, Key=s3_key)
-            content = s3_object['Body'].read()
+            if self._cache is not None and len(content) <= S3_CACHE_MAX_ITEM_SIZE:
+                self._cache[s3_key] = content
             
             logger.debug(f"S3 파일 다운로드 완료: s3://{self.s3_bucket}/{s3_key}")
             return content
             
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
                 logger.error(f"S3 파일을 찾을 수 없습니다: s3://{self.s3_bucket}/{s3_key}")
                 raise FileNotFoundError(f"S3 파일을 찾을 수 없습니다: s3://{self.s3_bucket}/{s3_key}")
             else:
@@ -115,6 +243,53 @@ class S3StorageService(StorageService):
             logger.error(f"S3 처리 중 예상치 못한 오류: {e}")
             raise Exception(f"S3 처리 중 오류 발생: {e}")
     
+    async def _download_ranges(self, s3, s3_key: str) -> bytes:
+        """
+        객체를 범위 GET으로 나누어 병렬로 다운로드합니다.
+        
+        첫 범위 응답의 Content-Range로 전체 크기를 확인하므로, 범위 크기보다 작은
+        객체는 추가 요청 없이 한 번의 GET으로 끝납니다.
+        """
+        try:
+            first = await self._call_with_retry(
+                s3.get_object, Bucket=self.s3_bucket, Key=s3_key, Range=f"bytes=0-{S3_RANGE_CHUNK_SIZE - 1}"
+            )
+        except ClientError as e:
+            # 빈 객체는 범위 요청이 InvalidRange(416)로 실패
+            if e.response['Error']['Code'] == 'InvalidRange':
+                return b""
+            raise
+        
+        async with first['Body'] as body:
+            head = await body.read()
+        
+        content_range = first.get('ContentRange')
+        total_size = int(content_range.rsplit('/', 1)[-1]) if content_range else len(head)
+        if total_size <= len(head):
+            return head
+        
+        # 나머지 범위를 동시 요청 수를 제한하여 병렬로 받아 미리 할당한 버퍼에 기록
+        buffer = bytearray(total_size)
+        buffer[:len(head)] = head
+        semaphore = asyncio.Semaphore(S3_RANGE_CONCURRENCY)
+        
+        async def fetch_into(start: int) -> None:
+            end = min(start + S3_RANGE_CHUNK_SIZE, total_size) - 1
+            async with semaphore:
+                response = await self._call_with_retry(
+                    s3.get_object, Bucket=self.s3_bucket, Key=s3_key, Range=f"bytes={start}-{end}"
+                )
+                async with response['Body'] as body:
+                    data = await body.read()
+            buffer[start:start + len(data)] = data
+        
+        await asyncio.gather(*(
+            fetch_into(start) for start in range(len(head), total_size, S3_RANGE_CHUNK_SIZE)
+        ))
+        
+        logger.debug(f"S3 병렬 범위 다운로드 완료: {s3_key} ({total_size} bytes)")
+        return bytes(buffer)
+    
     async def delete_file(self, identifier: str) -> bool:
         """
         S3에서 파일을 삭제합니다.
@@ -125,21 +300,55 @@ class S3StorageService(StorageService):
         Returns:
             bool: 삭제 성공 여부
         """
-        s3_key = identifier
+        results = await self.delete_files([identifier])
+        return results[identifier]
+    
+    async def delete_files(self, identifiers: List[str]) -> Dict[str, bool]:
+        """
+        S3에서 여러 파일을 DeleteObjects 요청으로 일괄 삭제합니다.
+        
+        Args:
+            identifiers: S3 키 목록
+            
+        Returns:
+            Dict[str, bool]: S3 키별 삭제 성공 여부
+        """
+        results = {s3_key: False for s3_key in identifiers}
+        if not results:
+            return results
+        
+        keys = list(results)
+        
+        # 삭제 대상은 읽기 캐시에서 먼저 제거
+        if self._cache is not None:
+            for s3_key in keys:
+                self._cache.pop(s3_key, None)
         
         try:
-            # S3 클라이언트 가져오기
-            s3 = self._get_s3_client()
+            s3 = await self._get_s3_client()
             
-            # S3에서 객체 삭제
-            s3.delete_object(Bucket=self.s3_bucket, Key=s3_key)
+            # 최대 1000개 단위로 나누어 삭제
+            for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+                batch = keys[start:start + S3_DELETE_BATCH_SIZE]
+                response = await self._call_with_retry(
+                    s3.delete_objects,
+                    Bucket=self.s3_bucket,
+                    Delete={'Objects': [{'Key': s3_key} for s3_key in batch], 'Quiet': True}
+                )
+                
+                # Quiet 모드에서는 실패한 키만 Errors에 포함됨
+                failed = {error['Key'] for error in response.get('Errors', [])}
+                for error in response.get('Errors', []):
+                    logger.warning(f"S3 객체 삭제 실패: {error['Key']} ({error.get('Code')}: {error.get('Message')})")
+                for s3_key in batch:
+                    results[s3_key] = s3_key not in failed
             
-            logger.debug(f"S3 객체 삭제 완료: s3://{self.s3_bucket}/{s3_key}")
-            return True
+            logger.debug(f"S3 객체 일괄 삭제 완료: {sum(results.values())}/{len(keys)}개")
+            return results
             
         except ClientError as e:
             logger.warning(f"S3 객체 삭제 실패: {e}")
-            return False
+            return results
         except Exception as e:
             logger.error(f"S3 삭제 처리 중 예상치 못한 오류: {e}")
-            return False 
\ No newline at end of file
+            return results
@@ -8,7 +8,10 @@ logger = get_logger("infrastructure.storage.factory")
 
 def get_storage_service(config: AppConfig) -> StorageService:
     """
-    설정에 따라 적절한 StorageService 구현체를 반환합니다.
+    설정에 따라 적절한 StorageService 구현체를 생성합니다.
+    
+    호출할 때마다 새 인스턴스를 만들며, 요청 간 재사용(및 S3 클라이언트 공유)은
+    app.core.dependencies의 lru_cache 의존성 함수가 담당합니다.
     
     Args:
         config: 애플리케이션 설정
@@ -29,4 +32,12 @@ def get_storage_service(config: AppConfig) -> StorageService:
     else:
         error_msg = f"지원하지 않는 저장소 유형입니다: {storage_type}"
         logger.error(error_msg)
-        raise ValueError(error_msg) 
\ No newline at end of file
+        raise ValueError(error_msg)
+
+async def close_storage_service(service: StorageService) -> None:
+    """
+    저장소 서비스의 리소스(S3 클라이언트 등)를 정리합니다.
+    """
+    close = getattr(service, "close", None)
+    if close is not None:
+        await close()
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+import asyncio
 from contextlib import asynccontextmanager
 import logging
 
@@ -6,6 +7,7 @@ import logging
 from app.core.config import AppConfig
 from app.core.logger import get_logger
 from app.core import dependencies
+from app.infrastructure.storage.storage_factory import close_storage_service
 
 # Adjust API router import
 from app.api.v1.base import api_router as api_v1_router
@@ -20,13 +22,39 @@ async def lifespan(app: FastAPI):
     # config = dependencies.get_app_config()
     # app.state.config = config
     
-    # Example: Initialize dependencies if needed
-    # dependencies.get_rag_service() # Trigger caching if desired
-    # logger.info("Dependencies initialized.")
+    config = dependencies.get_app_config()
+    if config.PRELOAD_MODELS:
+        await preload_models(config)
     
     yield # Application runs here
 
     logger.info("Application shutdown...")
+    # 생성된 저장소 서비스가 있을 때만 정리 (FastAPI 주입과 같은 키워드 인자로 캐시 조회)
+    if dependencies.get_storage_service.cache_info().currsize:
+        await close_storage_service(dependencies.get_storage_service(config=config))
+        dependencies.get_storage_service.cache_clear()
+
+async def preload_models(config: AppConfig) -> None:
+    """첫 요청 지연을 없애기 위해 시작 시점에 모델을 미리 로드
+
+    의존성 함수는 lru_cache로 캐시되므로 FastAPI가 주입할 때와 같은 키워드 인자로 호출해
+    요청 처리 시 같은 인스턴스가 재사용되도록 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    # 임베딩 모델은 가볍고 검색/인덱싱에 모두 쓰이므로 먼저 로드하고,
+    # 한 모델의 실패가 다른 모델의 로드를 막지 않도록 각각 처리
+    providers = (
+        ("embedding", dependencies.get_embedding_service),
+        ("LLM", dependencies.get_llm_service),
+    )
+    for name, provider in providers:
+        try:
+            logger.info(f"Preloading {name} model...")
+            await loop.run_in_executor(None, lambda: provider(config=config))
+            logger.info(f"{name} model preloaded.")
+        except Exception:
+            # 실패해도 첫 요청 시 다시 로드를 시도하므로 서버는 계속 기동
+            logger.exception(f"{name} model preload failed; falling back to lazy loading.")
 
 # --- FastAPI App Initialization ---
 def create_app() -> FastAPI:
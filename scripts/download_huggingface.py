@@ -1,7 +1,8 @@
-import subprocess
-import os
+import logging
 from pathlib import Path
 
+from downloader import download
+
 # 모델 설정
 MODEL_NAME = "EleutherAI/polyglot-ko-1.3b"
 OUTPUT_DIR = "./models"
@@ -13,29 +14,23 @@ model_dir.mkdir(parents=True, exist_ok=True)
 print(f"모델 다운로드 시작: {MODEL_NAME}")
 print(f"출력 경로: {model_dir}")
 
-# huggingface-cli 명령으로 다운로드
+logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+# 공통 다운로더로 HuggingFace 캐시에 다운로드하고 모델 디렉토리를 링크 (캐시 적중 시 재다운로드 없음)
 try:
-    subprocess.run([
-        "huggingface-cli", "download",
-        MODEL_NAME,
-        "--local-dir", str(model_dir),
-        "--local-dir-use-symlinks", "False"
-    ], check=True)
-    print("모델 다운로드 완료!")
+    link_path = download(MODEL_NAME, model_dir / MODEL_NAME.split('/')[-1], force=True)
+    print(f"모델 다운로드 완료! {link_path}")
 except Exception as e:
-    print(f"huggingface-cli 오류: {e}")
+    print(f"HuggingFace 다운로드 오류: {e}")
     print("대체 방법으로 다운로드 시도...")
     
-    # 실패하면 git clone으로 시도
+    # 실패하면 메타데이터 조회 타임아웃을 늘려 다시 시도
+    # (git clone은 .git에 LFS 사본을 한 벌 더 남기므로 사용하지 않음)
     try:
-        subprocess.run([
-            "git", "clone", 
-            f"https://huggingface.co/{MODEL_NAME}",
-            str(model_dir / MODEL_NAME.split('/')[-1])
-        ], check=True)
-        print("git을 통한 다운로드 완료!")
+        link_path = download(MODEL_NAME, model_dir / MODEL_NAME.split('/')[-1], force=True, etag_timeout=30)
+        print(f"재시도로 다운로드 완료! {link_path}")
     except Exception as e2:
-        print(f"git 다운로드 오류: {e2}")
+        print(f"재시도 다운로드 오류: {e2}")
         print("수동으로 다운로드 해주세요:")
         print(f"1. https://huggingface.co/{MODEL_NAME} 방문")
         print("2. 'Files and versions' 탭 클릭")
@@ -2,11 +2,10 @@
 import os
 import sys
 import argparse
-import shutil
-import subprocess
 import logging
 from pathlib import Path
-from huggingface_hub import snapshot_download, hf_hub_download
+
+from downloader import download, download_file
 
 # 로깅 설정 (스크립트 실행 시 사용)
 logging.basicConfig(
@@ -36,33 +35,15 @@ def download_gguf_model(model_name, output_dir=DEFAULT_GGUF_DIR, skip_if_exists=
 
     logger.info(f"GGUF 모델 저장 경로 확인: {local_model_path.resolve()}")
 
-    # 디렉토리 및 파일 존재 확인
-    if skip_if_exists and local_model_path.exists():
-        logger.info(f"GGUF 모델 파일이 이미 존재합니다: {local_model_path}")
-        return str(local_model_path)
-
-    # 출력 디렉토리 생성
-    os.makedirs(output_dir, exist_ok=True)
-    
-    logger.info(f"HuggingFace에서 GGUF 모델 다운로드 시작: {model_name} -> {local_model_path}")
     try:
-        # GGUF 모델 파일 직접 다운로드 
         # 참고: 실제 repo_id와 filename은 필요에 따라 조정해야 함
-        hf_hub_download(
-            repo_id="TheBloke/polyglot-ko-1.3B-GGUF",  # GGUF 버전 레포
-            filename="polyglot-ko-1.3b.q4_0.gguf",  # 실제 파일명 (크기가 작은 quantized 버전 선택)
-            local_dir=output_dir,
-            local_dir_use_symlinks=False,
+        path = download_file(
+            "TheBloke/polyglot-ko-1.3B-GGUF",  # GGUF 버전 레포
+            "polyglot-ko-1.3b.q4_0.gguf",  # 실제 파일명 (크기가 작은 quantized 버전 선택)
+            local_model_path,  # 원하는 파일명으로 캐시 파일에 링크
+            force=not skip_if_exists
         )
-        
-        # 필요에 따라 다운로드된 파일명을 원하는 이름으로 변경
-        downloaded_file = Path(output_dir) / "polyglot-ko-1.3b.q4_0.gguf"
-        if downloaded_file.exists() and downloaded_file != local_model_path:
-            shutil.move(str(downloaded_file), str(local_model_path))
-        
-        logger.info(f"GGUF 모델 다운로드 및 저장 완료: {local_model_path}")
-        return str(local_model_path)
-
+        return str(path)
     except Exception as e:
         logger.error(f"GGUF 모델 다운로드 실패: {e}")
         return None  # 실패 시 None 반환
@@ -82,44 +63,10 @@ def download_model(model_name, output_dir=DEFAULT_MODEL_DIR, skip_if_exists=True
 
     logger.info(f"모델 저장 경로 확인: {local_model_path.resolve()}")
 
-    # 디렉토리 존재 및 내용 확인 (skip_if_exists가 True일 때)
-    if skip_if_exists and local_model_path.exists() and any(local_model_path.iterdir()):
-        logger.info(f"모델 디렉토리가 이미 로컬 경로에 존재하며 비어있지 않습니다: {local_model_path}")
-        return str(local_model_path)
-
-    logger.info(f"HuggingFace에서 모델 다운로드 시작: {model_name} -> {local_model_path}")
     try:
-        # 임시 디렉토리에 먼저 다운로드 후 이동 (원자성 보장)
-        temp_dir = local_model_path.with_suffix('.temp')
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-            
-        snapshot_download(
-            repo_id=model_name, 
-            local_dir=str(temp_dir),
-            local_dir_use_symlinks=False, # Windows 호환성
-            # revision="main", # 특정 브랜치/태그 지정 가능
-            # allow_patterns=["*.bin", "*.json", "*.model"], # 특정 파일만 다운로드
-            # ignore_patterns=["*.safetensors", "*.onnx"], # 특정 파일 제외
-            # cache_dir=os.getenv("HF_HOME") or Path.home() / ".cache" / "huggingface" / "hub" # 캐시 디렉토리 지정 (선택 사항)
-        )
-        
-        # 기존 디렉토리 삭제 후 이동
-        if local_model_path.exists():
-            shutil.rmtree(local_model_path)
-        shutil.move(str(temp_dir), str(local_model_path))
-        
-        logger.info(f"모델 다운로드 및 저장 완료: {local_model_path}")
-        return str(local_model_path)
-
+        return str(download(model_name, local_model_path, force=not skip_if_exists))
     except Exception as e:
         logger.error(f"모델 다운로드 실패 ({model_name}): {e}")
-        # 실패 시 임시 디렉토리 정리
-        if temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir)
-            except OSError:
-                logger.warning(f"임시 디렉토리 삭제 실패: {temp_dir}")
         return None # 실패 시 None 반환
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
-import os
 import subprocess
 from pathlib import Path
 
+from downloader import download
+
 MODEL_NAME = "EleutherAI/polyglot-ko-1.3b"
 OUTPUT_DIR = "./models"
 
@@ -14,21 +15,15 @@ gguf_path = model_dir / f"{model_base_name}.gguf"
 
 print(f"모델 다운로드 시작: {MODEL_NAME}")
 
-temp_dir = model_dir / "temp_hf_model"
-temp_dir.mkdir(exist_ok=True)
-
-subprocess.run([
-    "python", "-m", "huggingface_hub", "download", 
-    MODEL_NAME, 
-    "--local-dir", str(temp_dir),
-    "--local-dir-use-symlinks", "False"
-], check=True)
+# HuggingFace 캐시에 다운로드하고 캐시된 스냅샷 경로를 바로 변환 입력으로 사용 (임시 복사본 없음)
+# 중단 후 다시 실행하면 받은 지점부터 이어받음
+snapshot_path = str(download(MODEL_NAME))
 
 print("모델 다운로드 완료, GGUF 변환 시작...")
 
 subprocess.run([
     "python", "-m", "llama_cpp.model_converter", 
-    "--model", str(temp_dir),
+    "--model", snapshot_path,
     "--output", str(gguf_path),
     "--type", "f16"
 ], check=True)
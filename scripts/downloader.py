@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+"""
+HuggingFace 모델 다운로드 공통 모듈
+
+다운로드 스크립트(download_model.py, download_local.py 등)가 공유하는
+재시도 정책, 다운로드 패턴, 캐시 링크 로직을 한 곳에 모아 둡니다.
+
+사용 예:
+    python scripts/downloader.py EleutherAI/polyglot-ko-1.3b --dest models/polyglot-ko-1.3b
+    python scripts/downloader.py TheBloke/polyglot-ko-1.3B-GGUF --file polyglot-ko-1.3b.q4_0.gguf --dest models/gguf/polyglot-ko-1.3b.gguf
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import logging
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# 대용량 LFS 파일을 여러 연결로 나눠 받도록 고속 다운로드 백엔드 활성화
+# huggingface_hub가 import 시점에 환경 변수를 읽으므로 import 전에 설정하며,
+# hf_transfer 미설치 상태에서 켜면 오류가 나므로 설치된 경우에만 활성화
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+os.environ.setdefault("HF_XET_NUM_CONCURRENT_RANGE_GETS", "64")
+# 대용량 LFS 파일 전송 중 응답 지연으로 끊기지 않도록 타임아웃 확대
+os.environ.setdefault("HF_HUB_DOWNLOAD_TIMEOUT", "300")
+
+from huggingface_hub import snapshot_download, hf_hub_download, HfApi, constants as hf_constants
+from huggingface_hub.utils import RepositoryNotFoundError, GatedRepoError, filter_repo_objects
+
+logger = logging.getLogger('model_downloader')
+
+# snapshot_download 동시 다운로드 파일 수
+DOWNLOAD_MAX_WORKERS = 8
+# 개별 파일 동시 다운로드 수
+INDIVIDUAL_DOWNLOAD_WORKERS = 4
+
+# 받을 파일 패턴 (설정/토크나이저 + 한 가지 가중치 포맷만 다운로드)
+ALLOW_PATTERNS = ["*.json", "*.safetensors", "*.bin", "tokenizer.*", "*.model", "*.txt"]
+# 중복 가중치 포맷 (ONNX/Flax/TF/Rust 등)은 항상 제외
+IGNORE_PATTERNS = ["*.onnx", "*.msgpack", "*.h5", "*.ot", "flax_model.*", "tf_model.*", "rust_model.*"]
+
+# 체크섬 계산 시 한 번에 읽는 크기
+HASH_CHUNK_SIZE = 1 << 20
+
+# 재시도 설정 (지수 백오프 + 지터, 초)
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# 재시도해도 결과가 같은 오류 (레포 없음/접근 권한 없음)
+UNRECOVERABLE_ERRORS = (RepositoryNotFoundError, GatedRepoError)
+
+def backoff_delay(attempt):
+    """재시도 대기 시간 계산 (여러 컨테이너가 동시에 재시도하지 않도록 지터 추가)"""
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt) * (1 + random.random() * 0.5))
+
+def call_with_retry(func, max_retries=MAX_RETRIES):
+    """일시적 오류는 지수 백오프로 재시도하고, 복구 불가능한 오류는 바로 전달"""
+    for attempt in range(max_retries):
+        try:
+            return func()
+        except UNRECOVERABLE_ERRORS:
+            raise
+        except Exception as e:
+            if attempt == max_retries - 1:
+                raise
+            wait_time = backoff_delay(attempt)
+            logger.warning(f"다운로드 실패 ({attempt + 1}/{max_retries}): {e}, {wait_time:.1f}초 후 재시도합니다...")
+            time.sleep(wait_time)
+
+def link_to_cache(cached_path, link_path):
+    """
+    HuggingFace 캐시에 받은 파일/디렉토리를 복사하지 않고 심볼릭 링크로 연결합니다.
+
+    새 링크를 임시 이름으로 만든 뒤 os.replace로 교체하므로 링크 경로가
+    없어지는 구간이 없습니다. (기존 실제 디렉토리는 먼저 옆으로 옮긴 뒤 삭제)
+
+    Args:
+        cached_path (str): hf_hub_download / snapshot_download가 반환한 캐시 경로
+        link_path (Path): 애플리케이션이 참조할 경로
+    """
+    link_path = Path(link_path)
+    link_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_link = link_path.with_name(f".{link_path.name}.tmp-{os.getpid()}")
+    if temp_link.is_symlink() or temp_link.exists():
+        temp_link.unlink()
+    temp_link.symlink_to(Path(cached_path).resolve(), target_is_directory=Path(cached_path).is_dir())
+
+    # 디렉토리는 링크로 바로 덮어쓸 수 없으므로 같은 파일시스템 안에서 O(1) 이름 변경으로 비켜 둠
+    old_dir = None
+    if link_path.is_dir() and not link_path.is_symlink():
+        old_dir = link_path.with_name(f"{link_path.name}.old")
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+        os.replace(link_path, old_dir)
+
+    os.replace(temp_link, link_path)
+
+    if old_dir is not None:
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+def select_weight_patterns(repo_id):
+    """
+    레포에 safetensors 가중치가 있으면 pytorch .bin 가중치를 제외하는 다운로드 패턴을 반환합니다.
+    (두 포맷을 모두 받으면 전송량이 약 두 배가 되므로 하나만 받음)
+
+    Args:
+        repo_id (str): HuggingFace 모델 이름
+
+    Returns:
+        tuple: (allow_patterns, ignore_patterns)
+    """
+    ignore_patterns = list(IGNORE_PATTERNS)
+    try:
+        if any(name.endswith(".safetensors") for name in HfApi().list_repo_files(repo_id)):
+            ignore_patterns.append("*.bin")
+    except Exception:
+        # 파일 목록 조회에 실패하면 .bin도 받도록 두어 가중치 누락 방지
+        pass
+    return ALLOW_PATTERNS, ignore_patterns
+
+def sha256_file(path):
+    """파일의 SHA-256 해시 (hex)
+
+    Python 3.11+에서는 hashlib.file_digest를 사용해 C 루프에서 버퍼를 재사용하며 해시하고
+    (OpenSSL의 SHA-NI 가속 경로 사용), 이전 버전에서는 큰 청크 단위로 읽어 해시합니다.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+def find_invalid_files(repo_id, local_dir, allow_patterns=None, ignore_patterns=None):
+    """
+    로컬 모델 디렉토리에서 누락되었거나 레포와 내용이 다른 파일 목록을 반환합니다.
+
+    LFS 파일(가중치 등)은 레포에 기록된 SHA-256과 비교하고, 일반 파일은 크기를 비교합니다.
+
+    Args:
+        repo_id (str): HuggingFace 모델 이름
+        local_dir (str | Path): 확인할 로컬 디렉토리
+        allow_patterns (list, optional): 확인할 파일 패턴
+        ignore_patterns (list, optional): 제외할 파일 패턴
+
+    Returns:
+        list: 다시 받아야 하는 레포 내 파일명 목록
+    """
+    siblings = HfApi().model_info(repo_id, files_metadata=True).siblings
+    siblings = filter_repo_objects(
+        siblings,
+        allow_patterns=allow_patterns,
+        ignore_patterns=ignore_patterns,
+        key=lambda sibling: sibling.rfilename
+    )
+
+    invalid = []
+    for sibling in siblings:
+        path = Path(local_dir) / sibling.rfilename
+        if not path.is_file():
+            invalid.append(sibling.rfilename)
+            continue
+
+        lfs = sibling.lfs
+        if lfs:
+            expected = lfs["sha256"] if isinstance(lfs, dict) else lfs.sha256
+            if sha256_file(path) != expected:
+                invalid.append(sibling.rfilename)
+        elif sibling.size is not None and path.stat().st_size != sibling.size:
+            invalid.append(sibling.rfilename)
+    return invalid
+
+def download(repo_id, dest=None, *, allow_patterns=None, ignore_patterns=None, force=False, etag_timeout=10):
+    """
+    모델 스냅샷을 HuggingFace 캐시에 다운로드하고 dest를 스냅샷에 링크합니다.
+
+    캐시에 이미 있는 파일은 다시 받지 않으며, 전송 중인 파일은 *.incomplete로 기록되므로
+    중단 후 다시 실행하면 받은 지점부터 이어받습니다.
+
+    Args:
+        repo_id (str): HuggingFace 모델 이름
+        dest (str | Path, optional): 애플리케이션이 참조할 경로 (없으면 캐시 경로만 반환)
+        allow_patterns (list, optional): 받을 파일 패턴 (없으면 레포에 맞게 자동 선택)
+        ignore_patterns (list, optional): 제외할 파일 패턴
+        force (bool): dest가 이미 있어도 다시 확인/링크할지 여부
+        etag_timeout (float): 파일 메타데이터(ETag) 조회 타임아웃 (초)
+
+    Returns:
+        Path: dest (지정된 경우) 또는 캐시된 스냅샷 경로
+    """
+    if allow_patterns is None and ignore_patterns is None:
+        allow_patterns, ignore_patterns = select_weight_patterns(repo_id)
+
+    if dest is not None and not force:
+        dest_path = Path(dest)
+        if dest_path.is_dir() and any(dest_path.iterdir()):
+            # 파일이 있다는 것만으로 건너뛰지 않고 체크섬으로 손상/누락 여부 확인
+            try:
+                invalid = find_invalid_files(repo_id, dest_path, allow_patterns, ignore_patterns)
+            except Exception as e:
+                # 오프라인 등으로 확인할 수 없으면 기존 파일을 그대로 사용
+                logger.warning(f"모델 파일 검증 실패, 기존 파일을 사용합니다: {e}")
+                return dest_path
+
+            if not invalid:
+                logger.info(f"모델 파일이 이미 존재하며 체크섬이 일치합니다: {dest_path}")
+                return dest_path
+
+            logger.warning(f"누락되었거나 손상된 파일 {len(invalid)}개: {invalid}")
+            if dest_path.is_symlink():
+                # 캐시 스냅샷에 연결된 경우 문제 파일만 강제로 다시 받음 (캐시의 손상된 blob도 교체)
+                call_with_retry(lambda: snapshot_download(
+                    repo_id=repo_id,
+                    allow_patterns=invalid,
+                    force_download=True,
+                    etag_timeout=etag_timeout,
+                    max_workers=DOWNLOAD_MAX_WORKERS
+                ))
+                logger.info(f"손상된 파일 복구 완료: {dest_path}")
+                return dest_path
+            # 캐시와 무관한 기존 복사본이면 전체를 캐시에 받아 링크로 교체
+
+    # CI/Docker 로그에서 캐시 볼륨이 제대로 연결되었는지 확인할 수 있도록 캐시 위치 출력
+    logger.info(f"HuggingFace에서 모델 다운로드 시작: {repo_id} (캐시: {hf_constants.HF_HUB_CACHE})")
+    snapshot_path = call_with_retry(lambda: snapshot_download(
+        repo_id=repo_id,
+        allow_patterns=allow_patterns,  # 설정/토크나이저/가중치만 다운로드
+        ignore_patterns=ignore_patterns,  # 중복 가중치 포맷 제외
+        resume_download=True,
+        etag_timeout=etag_timeout,
+        max_workers=DOWNLOAD_MAX_WORKERS  # 여러 파일을 병렬로 다운로드
+    ))
+
+    if dest is None:
+        return Path(snapshot_path)
+
+    # 복사 대신 스냅샷 디렉토리에 링크
+    link_to_cache(snapshot_path, dest)
+    logger.info(f"모델 다운로드 완료: {dest} -> {snapshot_path}")
+    return Path(dest)
+
+def download_file(repo_id, filename, dest, *, force=False):
+    """
+    레포의 파일 하나를 HuggingFace 캐시에 다운로드하고 dest를 캐시 파일에 링크합니다.
+
+    Args:
+        repo_id (str): HuggingFace 모델 이름
+        filename (str): 레포 내 파일명
+        dest (str | Path): 애플리케이션이 참조할 파일 경로 (파일명 변경 가능)
+        force (bool): dest가 이미 있어도 다시 확인/링크할지 여부
+
+    Returns:
+        Path: dest
+    """
+    dest_path = Path(dest)
+    if not force and dest_path.exists():
+        logger.info(f"파일이 이미 존재합니다: {dest_path}")
+        return dest_path
+
+    logger.info(f"HuggingFace에서 파일 다운로드 시작: {repo_id}/{filename} (캐시: {hf_constants.HF_HUB_CACHE})")
+    cached_file = call_with_retry(lambda: hf_hub_download(repo_id=repo_id, filename=filename))
+    link_to_cache(cached_file, dest_path)
+    logger.info(f"파일 다운로드 완료: {dest_path} -> {cached_file}")
+    return dest_path
+
+def download_files(repo_id, filenames, dest_dir, *, force=False):
+    """
+    여러 파일을 병렬로 다운로드합니다. (파일별 요청 지연이 겹치도록 스레드 풀 사용)
+
+    Returns:
+        dict: 파일명 -> 링크된 경로 (실패한 파일은 None)
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=INDIVIDUAL_DOWNLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(download_file, repo_id, filename, Path(dest_dir) / filename, force=force): filename
+            for filename in filenames
+        }
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                results[filename] = future.result()
+            except Exception as e:
+                logger.error(f"{filename} 다운로드 실패: {e}")
+                results[filename] = None
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HuggingFace 모델 다운로드")
+    parser.add_argument("repo_id", help="HuggingFace 모델 이름 (예: EleutherAI/polyglot-ko-1.3b)")
+    parser.add_argument("--dest", help="링크를 만들 경로 (없으면 캐시 경로만 출력)")
+    parser.add_argument("--file", help="스냅샷 대신 받을 단일 파일명 (--dest 필요)")
+    parser.add_argument("--force", action="store_true", help="대상 경로가 이미 있어도 다시 다운로드/링크")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.file:
+            if not args.dest:
+                parser.error("--file 사용 시 --dest가 필요합니다")
+            path = download_file(args.repo_id, args.file, args.dest, force=args.force)
+        else:
+            path = download(args.repo_id, args.dest, force=args.force)
+    except Exception as e:
+        logger.error(f"다운로드 실패 ({args.repo_id}): {e}")
+        return 1
+
+    print(path)
+    return 0
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+    sys.exit(main())
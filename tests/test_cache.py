@@ -0,0 +1,245 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock, AsyncMock
+
+import numpy as np
+import pytest
+
+from app.infrastructure.embedding import semantic_cache
+from app.infrastructure.embedding.semantic_cache import SemanticAnswerCache
+from app.infrastructure.embedding.embedding_cache import EmbeddingCache
+from app.application.use_cases.chat import ChatUseCase, ChatInput, EMPTY_QUERY_ERROR
+from app.application.use_cases.index_document import IndexDocumentUseCase, IndexDocumentInput
+from app.domain.entities.document import DocumentEntity
+from app.domain.value_objects.document_chunk import DocumentChunk
+
+VECTOR_SIZE = 4
+
+def unit(*values):
+    """정규화된 float32 벡터 생성"""
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+class TestSemanticAnswerCache:
+    """시맨틱 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def cache(self):
+        return SemanticAnswerCache(vector_size=VECTOR_SIZE, max_entries=2, threshold=0.95, ttl_seconds=60)
+
+    def test_exact_hit(self, cache):
+        """같은 쿼리 키로 저장된 응답 반환"""
+        key = SemanticAnswerCache.make_key("질문")
+        cache.put(unit(1, 0, 0, 0), {"message": "답변"}, key=key)
+
+        assert cache.get_exact(key) == {"message": "답변"}
+        assert cache.get_exact(SemanticAnswerCache.make_key("다른 질문")) is None
+
+    def test_semantic_hit_and_miss(self, cache):
+        """임계값 이상으로 유사한 임베딩만 적중"""
+        cache.put(unit(1, 0, 0, 0), {"message": "답변"})
+
+        assert cache.get(unit(1, 0.05, 0, 0)) == {"message": "답변"}
+        assert cache.get(unit(1, 1, 0, 0)) is None
+
+    def test_ttl_expiry(self, cache, monkeypatch):
+        """유효 시간이 지난 항목은 반환하지 않고 제거"""
+        now = [1000.0]
+        monkeypatch.setattr(semantic_cache.time, "monotonic", lambda: now[0])
+        key = SemanticAnswerCache.make_key("질문")
+        cache.put(unit(1, 0, 0, 0), {"message": "답변"}, key=key)
+
+        now[0] += 61
+        assert cache.get_exact(key) is None
+        assert cache.get(unit(1, 0, 0, 0)) is None
+
+    def test_lru_eviction(self, cache):
+        """가득 차면 가장 오래 사용하지 않은 항목을 제거"""
+        key_a = SemanticAnswerCache.make_key("a")
+        key_b = SemanticAnswerCache.make_key("b")
+        cache.put(unit(1, 0, 0, 0), {"message": "a"}, key=key_a)
+        cache.put(unit(0, 1, 0, 0), {"message": "b"}, key=key_b)
+
+        # a를 사용하여 b가 가장 오래된 항목이 되도록 함
+        assert cache.get_exact(key_a) is not None
+        cache.put(unit(0, 0, 1, 0), {"message": "c"})
+
+        assert cache.get_exact(key_a) == {"message": "a"}
+        assert cache.get_exact(key_b) is None
+        assert cache.get(unit(0, 1, 0, 0)) is None
+
+    def test_clear(self, cache):
+        """초기화 후에는 모든 조회가 실패"""
+        key = SemanticAnswerCache.make_key("질문")
+        cache.put(unit(1, 0, 0, 0), {"message": "답변"}, key=key)
+        cache.clear()
+
+        assert cache.get_exact(key) is None
+        assert cache.get(unit(1, 0, 0, 0)) is None
+
+class TestEmbeddingCache:
+    """임베딩 캐시 테스트"""
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.float16])
+    def test_roundtrip(self, tmp_path, dtype):
+        """저장한 임베딩을 같은 타입으로 다시 읽음"""
+        cache = EmbeddingCache(db_path=str(tmp_path / "cache.sqlite3"), model_id="model", dtype=dtype)
+        key = cache.make_key("텍스트")
+        vector = unit(1, 2, 3, 4)
+        cache.put_many([(key, vector)])
+
+        found = cache.get_many([key, cache.make_key("없는 텍스트")])
+
+        assert list(found) == [key]
+        assert found[key].dtype == dtype
+        np.testing.assert_allclose(found[key], vector, atol=1e-3)
+
+    def test_dtype_changes_key(self, tmp_path):
+        """저장 타입이 다르면 기존 항목을 잘못 읽지 않도록 키가 달라짐"""
+        db_path = str(tmp_path / "cache.sqlite3")
+        float32_cache = EmbeddingCache(db_path=db_path, model_id="model")
+        float16_cache = EmbeddingCache(db_path=db_path, model_id="model", dtype=np.float16)
+
+        assert float32_cache.make_key("텍스트") != float16_cache.make_key("텍스트")
+
+class TestChatUseCaseCache:
+    """챗 유스케이스 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def embedding_service(self):
+        service = MagicMock()
+        service.embed_text = AsyncMock(return_value=unit(1, 0, 0, 0))
+        return service
+
+    @pytest.fixture
+    def chunk_repository(self):
+        repository = MagicMock()
+        repository.search = AsyncMock(return_value=[
+            {"text": "관련 내용", "document_id": "doc1", "page": 1, "score": 0.9}
+        ])
+        return repository
+
+    @pytest.fixture
+    def rag_service(self):
+        service = MagicMock()
+        service.generate_answer = AsyncMock(return_value="답변입니다")
+        service.fit_context = AsyncMock(side_effect=lambda query, context, max_tokens: context)
+        return service
+
+    @pytest.fixture
+    def use_case(self, chunk_repository, rag_service, embedding_service):
+        return ChatUseCase(
+            chunk_repository=chunk_repository,
+            rag_service=rag_service,
+            config=MagicMock(),
+            embedding_service=embedding_service,
+            answer_cache=SemanticAnswerCache(VECTOR_SIZE, max_entries=8, threshold=0.95, ttl_seconds=60)
+        )
+
+    def test_exact_hit_skips_embedding_and_generation(self, use_case, embedding_service, chunk_repository, rag_service):
+        """같은 질문은 임베딩/검색/생성 없이 캐시에서 응답"""
+        first = asyncio.run(use_case.execute(ChatInput(message="질문입니다")))
+        second = asyncio.run(use_case.execute(ChatInput(message="질문입니다")))
+
+        assert first.success and second.success
+        assert second.message == first.message == "답변입니다"
+        assert embedding_service.embed_text.await_count == 1
+        assert chunk_repository.search.await_count == 1
+        assert rag_service.generate_answer.await_count == 1
+
+    def test_semantic_hit_skips_generation(self, use_case, embedding_service, rag_service):
+        """유사한 질문은 임베딩만 하고 생성은 생략"""
+        asyncio.run(use_case.execute(ChatInput(message="질문입니다")))
+        result = asyncio.run(use_case.execute(ChatInput(message="질문이에요")))
+
+        assert result.message == "답변입니다"
+        assert embedding_service.embed_text.await_count == 2
+        assert rag_service.generate_answer.await_count == 1
+
+    def test_failed_generation_not_cached(self, use_case, rag_service):
+        """생성 실패는 캐시하지 않아 다음 요청에서 다시 생성"""
+        rag_service.generate_answer.side_effect = [RuntimeError("응답 생성 실패"), "답변입니다"]
+
+        first = asyncio.run(use_case.execute(ChatInput(message="질문입니다")))
+        second = asyncio.run(use_case.execute(ChatInput(message="질문입니다")))
+
+        assert not first.success
+        assert second.success and second.message == "답변입니다"
+        assert rag_service.generate_answer.await_count == 2
+
+    def test_empty_query_skips_embedding_and_search(self, use_case, embedding_service, chunk_repository, rag_service):
+        """공백뿐인 질문은 임베딩/검색/생성 없이 오류 반환"""
+        result = asyncio.run(use_case.execute(ChatInput(message="   ")))
+
+        assert not result.success
+        assert result.error == EMPTY_QUERY_ERROR
+        embedding_service.embed_text.assert_not_awaited()
+        chunk_repository.search.assert_not_awaited()
+        rag_service.generate_answer.assert_not_awaited()
+
+class TestIndexDocumentUseCaseCache:
+    """문서 인덱싱 시 응답 캐시 초기화 테스트"""
+
+    @pytest.fixture
+    def answer_cache(self):
+        cache = SemanticAnswerCache(VECTOR_SIZE, max_entries=8, threshold=0.95, ttl_seconds=60)
+        cache.put(unit(1, 0, 0, 0), {"message": "이전 답변"}, key=SemanticAnswerCache.make_key("질문"))
+        return cache
+
+    def make_use_case(self, answer_cache, save_result):
+        document_repository = MagicMock()
+        document_repository.find_by_id = AsyncMock(
+            return_value=DocumentEntity(id="doc1", filename="sample.txt", upload_date=datetime.now())
+        )
+        document_repository.update = AsyncMock()
+        storage_service = MagicMock()
+        storage_service.read_file = AsyncMock(return_value=b"content")
+        storage_service.delete_file = AsyncMock(return_value=True)
+        processing_service = MagicMock()
+        processing_service.iter_document_chunks.return_value = iter([
+            DocumentChunk(text="청크", source="sample.txt", document_id="doc1", index=0)
+        ])
+        chunk_repository = MagicMock()
+        chunk_repository.save_chunks = AsyncMock(return_value=save_result)
+        chunk_repository.delete_by_document_id = AsyncMock(return_value=True)
+        use_case = IndexDocumentUseCase(
+            document_repository=document_repository,
+            chunk_repository=chunk_repository,
+            document_processing_service=processing_service,
+            storage_service=storage_service,
+            config=MagicMock(),
+            answer_cache=answer_cache
+        )
+        return use_case, document_repository, chunk_repository
+
+    def test_success_clears_cache(self, answer_cache):
+        """인덱싱 성공 시 기존 응답 캐시 초기화"""
+        use_case, document_repository, _ = self.make_use_case(answer_cache, save_result=True)
+
+        result = asyncio.run(use_case.execute(IndexDocumentInput(document_id="doc1")))
+
+        assert result.success
+        document_repository.update.assert_awaited_once()
+        assert answer_cache.get_exact(SemanticAnswerCache.make_key("질문")) is None
+
+    def test_save_failure_keeps_cache_and_document_unindexed(self, answer_cache):
+        """청크 저장 실패 시 문서를 인덱싱 완료로 표시하지 않고 캐시도 유지"""
+        use_case, document_repository, chunk_repository = self.make_use_case(answer_cache, save_result=False)
+
+        result = asyncio.run(use_case.execute(IndexDocumentInput(document_id="doc1")))
+
+        assert not result.success
+        document_repository.update.assert_not_awaited()
+        chunk_repository.delete_by_document_id.assert_awaited_once_with("doc1")
+        assert answer_cache.get_exact(SemanticAnswerCache.make_key("질문")) is not None
+
+    def test_save_exception_deletes_partial_chunks(self, answer_cache):
+        """청크 저장 중 예외가 나도 부분 저장된 청크를 제거"""
+        use_case, document_repository, chunk_repository = self.make_use_case(answer_cache, save_result=True)
+        chunk_repository.save_chunks.side_effect = RuntimeError("업로드 실패")
+
+        result = asyncio.run(use_case.execute(IndexDocumentInput(document_id="doc1")))
+
+        assert not result.success
+        document_repository.update.assert_not_awaited()
+        chunk_repository.delete_by_document_id.assert_awaited_once_with("doc1")
@@ -5,9 +5,9 @@ from app.embedding import ModelManager
 class TestEmbedding:
     """임베딩 관련 테스트"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def model_manager(self):
-        """테스트용 ModelManager 인스턴스"""
+        """테스트용 ModelManager 인스턴스 (모델 로딩 비용이 크므로 클래스 내 테스트에서 공유)"""
         return ModelManager()
     
     def test_model_loading(self, model_manager):
@@ -46,18 +46,17 @@ class TestEmbedding:
         text2 = "AI는 기계가 인간의 사고 과정을 모방하는 기술입니다."
         text3 = "축구는 공을 발로 차는 스포츠입니다."
         
-        emb1 = model_manager.get_embeddings(text1)
-        emb2 = model_manager.get_embeddings(text2)
-        emb3 = model_manager.get_embeddings(text3)
+        # 세 문장을 한 번의 배치로 임베딩
+        embeddings = np.asarray(model_manager.get_embeddings([text1, text2, text3]))
         
-        # 코사인 유사도 계산 함수
-        def cosine_similarity(a, b):
-            return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        # 행 단위 정규화 후 행렬 곱 한 번으로 코사인 유사도 행렬 계산
+        embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        similarities = embeddings @ embeddings.T
         
         # 유사한 텍스트(1과 2) 사이의 유사도는 높아야 함
-        sim_1_2 = cosine_similarity(emb1, emb2)
+        sim_1_2 = similarities[0, 1]
         # 다른 텍스트(1과 3) 사이의 유사도는 낮아야 함
-        sim_1_3 = cosine_similarity(emb1, emb3)
+        sim_1_3 = similarities[0, 2]
         
         assert sim_1_2 > sim_1_3, "의미적으로 유사한 텍스트의 임베딩 유사도가 기대와 다릅니다."
         assert sim_1_2 > 0.7, f"유사한 텍스트의 유사도가 너무 낮습니다: {sim_1_2}"
@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import types
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.infrastructure.embedding import embedding_service
+from app.infrastructure.embedding.embedding_service import SentenceTransformerEmbedding
+
+class FakeModel:
+    """텍스트 숫자를 값으로 하는 벡터를 반환하는 가짜 SentenceTransformer"""
+
+    def __init__(self):
+        self.calls = []
+        self.error = None
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return np.asarray([[float(text), 1.0] for text in texts])
+
+class TestMicroBatcher:
+    """단건 임베딩 요청 마이크로 배치 테스트"""
+
+    @pytest.fixture
+    def model(self):
+        return FakeModel()
+
+    @pytest.fixture
+    def service(self, model, monkeypatch):
+        fake_module = types.ModuleType("sentence_transformers")
+        fake_module.SentenceTransformer = lambda name: model
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+        config = MagicMock(EMBEDDING_MODEL_ID="fake-model", EMBEDDING_BATCH_SIZE=32, EMBEDDING_BACKEND="torch")
+        return SentenceTransformerEmbedding(config)
+
+    def embed_concurrently(self, service, texts):
+        async def run():
+            return await asyncio.gather(*(service.embed_text(text) for text in texts))
+        return asyncio.run(run())
+
+    def test_concurrent_requests_share_one_encode(self, service, model):
+        """동시 요청은 한 번의 encode로 묶이고 각자 자기 순서의 행을 받음"""
+        texts = [str(i) for i in range(5)]
+
+        results = self.embed_concurrently(service, texts)
+
+        assert model.calls == [texts]
+        for i, result in enumerate(results):
+            assert result.dtype == np.float32
+            np.testing.assert_array_equal(result, [float(i), 1.0])
+
+    def test_full_batch_flushes_without_waiting(self, service, model):
+        """최대 배치 크기를 넘으면 크기 단위로 나누어 인코딩"""
+        count = embedding_service.MICRO_BATCH_MAX_SIZE + 2
+        texts = [str(i) for i in range(count)]
+
+        results = self.embed_concurrently(service, texts)
+
+        assert [len(call) for call in model.calls] == [embedding_service.MICRO_BATCH_MAX_SIZE, 2]
+        assert [result[0] for result in results] == [float(i) for i in range(count)]
+
+    def test_encode_failure_resolves_all_to_none(self, service, model):
+        """encode 실패 시 묶인 모든 요청이 None을 받음 (대기 상태로 남지 않음)"""
+        model.error = RuntimeError("encode 실패")
+
+        results = self.embed_concurrently(service, ["1", "2", "3"])
+
+        assert results == [None, None, None]
+        assert len(model.calls) == 1
+
+    def test_empty_text_not_batched(self, service, model):
+        """빈 텍스트는 인코딩하지 않고 None 반환"""
+        assert self.embed_concurrently(service, ["  "]) == [None]
+        assert model.calls == []
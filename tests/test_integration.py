@@ -1,73 +1,83 @@
 import pytest
 import os
-import tempfile
 import requests
+from requests.adapters import HTTPAdapter
 import time
 
 # 기본 API URL 설정
 BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:8000")
 
-class TestIntegration:
-    """통합 테스트 (requests 사용)"""
-    
-    @pytest.fixture
-    def sample_document(self):
-        """샘플 TXT 문서 생성"""
-        # 간단한 텍스트 내용
-        content = "이것은 샘플 텍스트 문서입니다.\n두 번째 줄입니다."
+# 샘플 TXT 문서 (임시 파일 없이 바이트로 바로 업로드)
+SAMPLE_DOCUMENT_NAME = "sample.txt"
+SAMPLE_DOCUMENT_BYTES = "이것은 샘플 텍스트 문서입니다.\n두 번째 줄입니다.".encode("utf-8")
+
+@pytest.fixture(scope="module")
+def http():
+    """모듈 전체에서 연결을 재사용하는 HTTP 세션 (keep-alive)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    yield session
+    session.close()
+
+def wait_until_indexed(http, document_id, timeout=10.0):
+    """문서가 인덱싱될 때까지 목록 API를 지수 백오프로 폴링 (인덱싱 여부 반환)"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        response = http.get(f"{BASE_URL}/documents/")
+        if response.status_code == 200 and any(
+            doc.get("id") == document_id and doc.get("indexed") for doc in response.json()
+        ):
+            return True
+        time.sleep(delay)
+        delay = min(1.0, delay * 2)
+    return False
 
-        # 임시 파일 생성 (접미사를 .txt로 변경)
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False, mode='w', encoding='utf-8') as f:
-            f.write(content)
-            path = f.name
+@pytest.fixture(scope="module")
+def uploaded_doc_id(http):
+    """샘플 문서를 한 번만 업로드하고 문서 ID 반환 (업로드/인덱싱 비용을 테스트 간 공유)"""
+    # content_type을 text/plain으로 명시
+    files = {"file": (SAMPLE_DOCUMENT_NAME, SAMPLE_DOCUMENT_BYTES, "text/plain")}
+    upload_response = http.post(f"{BASE_URL}/documents/upload/", files=files)
 
-        yield path
+    assert upload_response.status_code == 200
+    upload_json = upload_response.json()
+    assert upload_json.get("success") is True
+    document_id = upload_json.get("document_id")
+    assert document_id is not None
+    return document_id
 
-        # 테스트 후 파일 삭제
-        if os.path.exists(path):
-            os.remove(path)
+class TestIntegration:
+    """통합 테스트 (requests 사용)"""
     
-    def test_health_check(self):
+    def test_health_check(self, http):
         """헬스 체크 엔드포인트 테스트"""
-        response = requests.get(f"{BASE_URL}/health/")
+        response = http.get(f"{BASE_URL}/health/")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
     
-    def test_document_upload_and_query(self, sample_document):
+    def test_document_upload_and_query(self, http, uploaded_doc_id):
         """문서 업로드 및 질의 통합 테스트"""
-        # 1. 문서 업로드 (client 대신 requests 사용)
-        with open(sample_document, "rb") as f: # 'rb'로 읽는 것 유지 (requests files는 바이너리 필요)
-            # content_type을 text/plain으로 명시
-            files = {"file": (os.path.basename(sample_document), f, "text/plain")}
-            upload_response = requests.post(f"{BASE_URL}/documents/upload/", files=files)
-
-        assert upload_response.status_code == 200
-        upload_json = upload_response.json()
-        assert upload_json.get("success") is True
-        document_id = upload_json.get("document_id")
-        assert document_id is not None
+        # 1. 문서 업로드 (uploaded_doc_id 픽스처에서 한 번 수행)
+        document_id = uploaded_doc_id
         
-        # 인덱싱 완료 대기
-        time.sleep(2)
+        # 인덱싱 완료 대기 (고정 대기 대신 완료 즉시 진행)
+        assert wait_until_indexed(http, document_id), "인덱싱이 제한 시간 내에 완료되지 않았습니다"
         
         # 2. 질의 수행 (client 대신 requests 사용)
         query_data = {"query": "이 문서는 무엇에 관한 것입니까?"}
-        query_response = requests.post(f"{BASE_URL}/query/", json=query_data)
+        query_response = http.post(f"{BASE_URL}/query/", json=query_data)
         
         assert query_response.status_code == 200
         assert "answer" in query_response.json()
     
-    def test_document_listing(self, sample_document):
+    def test_document_listing(self, http, uploaded_doc_id):
         """문서 목록 조회 테스트"""
-        # 먼저 문서 업로드 (client 대신 requests 사용)
-        with open(sample_document, "rb") as f:
-             # content_type을 text/plain으로 명시
-            files = {"file": (os.path.basename(sample_document), f, "text/plain")}
-            requests.post(f"{BASE_URL}/documents/upload/", files=files)
-            time.sleep(1) # 업로드 처리 시간 약간 대기
-        
+        # 문서 업로드는 uploaded_doc_id 픽스처에서 한 번 수행
         # 문서 목록 조회
-        response = requests.get(f"{BASE_URL}/documents/")
+        response = http.get(f"{BASE_URL}/documents/")
         
         assert response.status_code == 200
         response_json = response.json()
@@ -82,17 +92,12 @@ class TestIntegration:
         assert "filename" in document
         assert "upload_date" in document
     
-    def test_error_handling(self):
+    def test_error_handling(self, http):
         """에러 처리 테스트"""
         # 1. 잘못된 파일 형식으로 업로드 (client 대신 requests 사용)
         invalid_content = b"invalid content"
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=True) as f: # delete=True로 변경하여 자동 삭제
-            f.write(invalid_content)
-            f.flush() # 내용을 파일에 쓰도록 보장
-            # 파일을 다시 열지 않고 파일 이름과 내용을 직접 사용
-            files = {"file": (os.path.basename(f.name), invalid_content, "application/octet-stream")}
-            # with 블록이 끝나면 파일이 자동으로 닫히고 삭제됨
-            response = requests.post(f"{BASE_URL}/documents/upload/", files=files)
+        files = {"file": ("invalid.xyz", invalid_content, "application/octet-stream")}
+        response = http.post(f"{BASE_URL}/documents/upload/", files=files)
 
         # 적절한 에러 응답 확인
         assert response.status_code in [400, 415, 422]  # 클라이언트 에러
@@ -100,21 +105,21 @@ class TestIntegration:
 
         # 2. 빈 쿼리 테스트 (client 대신 requests 사용)
         query_data = {"query": ""}
-        response = requests.post(f"{BASE_URL}/query/", json=query_data)
+        response = http.post(f"{BASE_URL}/query/", json=query_data)
 
         assert response.status_code in [400, 422]  # 클라이언트 에러
         assert "error" in response.json()
     
     @pytest.mark.skipif(not os.environ.get("RUN_LIVE_TESTS"), reason="라이브 테스트 건너뜀")
-    def test_live_server(self):
+    def test_live_server(self, http):
         """실제 서버에 대한 테스트 (선택적)"""
         base_url = os.environ.get("API_BASE_URL", "http://localhost:8000")
         
         # 헬스 체크
-        response = requests.get(f"{base_url}/health/")
+        response = http.get(f"{base_url}/health/")
         assert response.status_code == 200
         
         # 간단한 질의
         query_data = {"query": "안녕하세요"}
-        response = requests.post(f"{base_url}/query/", json=query_data)
+        response = http.post(f"{base_url}/query/", json=query_data)
         assert response.status_code == 200 
\ No newline at end of file
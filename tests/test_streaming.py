@@ -0,0 +1,128 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infrastructure.llm.llama_service import LlamaService
+from app.api.v1.router.chat import chat_with_documents_stream
+from app.api.v1.schemas.chat import ChatRequest
+
+class FakeGeneratorModel:
+    """ctransformers 모델처럼 stream=True 호출 시 토큰 제너레이터를 반환하는 가짜 모델
+
+    gate가 주어지면 첫 토큰 이후의 토큰은 gate가 열릴 때까지 기다렸다가 생성합니다.
+    """
+
+    def __init__(self, tokens, error=None, gate=None):
+        self.tokens = tokens
+        self.error = error
+        self.gate = gate
+        self.produced = []
+        self.finished = threading.Event()
+
+    def __call__(self, prompt, **kwargs):
+        return self._generate()
+
+    def _generate(self):
+        try:
+            for i, token in enumerate(self.tokens):
+                if i > 0 and self.gate is not None:
+                    self.gate.wait(timeout=1)
+                self.produced.append(token)
+                yield token
+            if self.error is not None:
+                raise self.error
+        finally:
+            self.finished.set()
+
+def make_service(model, monkeypatch):
+    """모델 파일 로드 없이 가짜 모델을 사용하는 LlamaService 생성"""
+    monkeypatch.setattr(LlamaService, "_load_model", lambda self: None)
+    service = LlamaService(MagicMock())
+    service.model = model
+    return service
+
+class TestGenerateStream:
+    """추론 스레드 -> 이벤트 루프 토큰 전달 테스트"""
+
+    def test_tokens_in_order(self, monkeypatch):
+        """생성된 토큰을 순서대로 전달"""
+        service = make_service(FakeGeneratorModel(["안", "녕", "하세요"]), monkeypatch)
+
+        async def run():
+            return [token async for token in service.generate_stream("프롬프트")]
+
+        assert asyncio.run(run()) == ["안", "녕", "하세요"]
+
+    def test_mid_stream_error_raised_after_tokens(self, monkeypatch):
+        """생성 도중 예외는 이미 생성된 토큰을 전달한 뒤 소비자에게 전달"""
+        service = make_service(FakeGeneratorModel(["a", "b"], error=RuntimeError("생성 실패")), monkeypatch)
+        received = []
+
+        async def run():
+            async for token in service.generate_stream("프롬프트"):
+                received.append(token)
+
+        with pytest.raises(RuntimeError, match="생성 실패"):
+            asyncio.run(run())
+        assert received == ["a", "b"]
+
+    def test_aclose_stops_and_awaits_producer(self, monkeypatch):
+        """소비자가 중단하면 생성을 멈추고 추론 스레드 종료까지 기다림"""
+        gate = threading.Event()
+        model = FakeGeneratorModel(["a", "b", "c", "d", "e"], gate=gate)
+        service = make_service(model, monkeypatch)
+
+        async def run():
+            stream = service.generate_stream("프롬프트")
+            first = await stream.__anext__()
+            # aclose가 중단 플래그를 설정한 뒤에 다음 토큰 생성을 허용
+            asyncio.get_running_loop().call_later(0.01, gate.set)
+            await stream.aclose()
+            return first, model.finished.is_set()
+
+        first, finished_on_close = asyncio.run(run())
+
+        assert first == "a"
+        assert finished_on_close
+        assert model.produced == ["a", "b"]
+
+class TestChatStreamEndpoint:
+    """챗 스트리밍 SSE 응답 형식 테스트"""
+
+    def make_use_case(self, events, error=None):
+        async def execute_stream(input_data):
+            for event in events:
+                yield event
+            if error is not None:
+                raise error
+
+        use_case = MagicMock()
+        use_case.execute_stream = execute_stream
+        return use_case
+
+    def collect(self, use_case):
+        async def run():
+            response = await chat_with_documents_stream(ChatRequest(message="질문"), use_case)
+            return [frame async for frame in response.body_iterator]
+        return asyncio.run(run())
+
+    def test_events_then_done(self):
+        """각 이벤트를 data 프레임으로 보내고 마지막에 [DONE] 전송"""
+        events = [{"type": "sources", "sources": []}, {"type": "token", "text": "답변"}]
+
+        frames = self.collect(self.make_use_case(events))
+
+        assert frames == [f"data: {json.dumps(event, ensure_ascii=False)}\n\n" for event in events] + ["data: [DONE]\n\n"]
+
+    def test_error_event_then_done(self):
+        """스트리밍 도중 예외는 error 이벤트로 보낸 뒤 [DONE]으로 종료"""
+        use_case = self.make_use_case([{"type": "token", "text": "답"}], error=RuntimeError("생성 실패"))
+
+        frames = self.collect(use_case)
+
+        assert frames[0] == 'data: {"type": "token", "text": "답"}\n\n'
+        assert json.loads(frames[1][len("data: "):]) == {"type": "error", "error": "생성 실패"}
+        assert frames[2:] == ["data: [DONE]\n\n"]